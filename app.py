@@ -1,20 +1,26 @@
 import sys
 import os
 import threading
-import json
-import queue
+import multiprocessing
 import difflib
-import base64
 import re
+import itertools
+from collections import deque
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QTextEdit, QPushButton, QLabel, QFileDialog, QMessageBox,
-    QCheckBox, QLineEdit, QDialog, QListWidget, QListWidgetItem,
-    QDialogButtonBox, QScrollArea, QComboBox, QFormLayout, QInputDialog
+    QCheckBox, QLineEdit, QDialog,
+    QDialogButtonBox, QScrollArea, QComboBox, QFormLayout, QInputDialog,
+    QListView, QAbstractItemView, QStyledItemDelegate, QStyle, QStyleOptionButton
+)
+from PySide6.QtGui import QFont, QFontMetrics, QStandardItem, QStandardItemModel
+from PySide6.QtCore import (
+    Signal, QObject, Qt, QRunnable, QThreadPool, QTimer, QSignalBlocker,
+    QAbstractListModel, QModelIndex, QEvent, QRect, QSize
 )
-from PySide6.QtCore import Signal, QObject, Qt
-from pdf_engine import create_pdf_page, merge_pdfs
 from file_processor import process_conversation_file
+from json_io import load_json_bytes, dump_json_bytes
+from pdf_worker import pdf_worker_main
 
 # --- File Selection Dialog ---
 class FileSelectionDialog(QDialog):
@@ -25,7 +31,8 @@ class FileSelectionDialog(QDialog):
     change the processing order.
 
     Attributes:
-        list_widget (QListWidget): A widget to display the list of files.
+        model (QStandardItemModel): The checkable file names, in display order.
+        list_view (QListView): The view displaying the list of files.
     """
     def __init__(self, files, parent=None):
         """Initializes the FileSelectionDialog.
@@ -40,23 +47,38 @@ class FileSelectionDialog(QDialog):
 
         layout = QVBoxLayout(self)
 
-        self.list_widget = QListWidget()
-        self.list_widget.setDragDropMode(QListWidget.InternalMove)
-
+        # Build every item up front and hand them to the model in one call;
+        # the view only creates and paints what is visible.
+        items = []
         total_files = len(files)
         for i, file in enumerate(files):
-            item = QListWidgetItem(file)
-            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
-            
+            item = QStandardItem(file)
+            item.setEditable(False)
+            item.setCheckable(True)
+            # Dropping onto an item would nest the dragged row under it.
+            item.setDropEnabled(False)
+
             # Default: Only check the latest file (the last one in the list)
             if i == total_files - 1:
                 item.setCheckState(Qt.Checked)
             else:
                 item.setCheckState(Qt.Unchecked)
-                
-            self.list_widget.addItem(item)
 
-        layout.addWidget(self.list_widget)
+            items.append(item)
+
+        self.model = QStandardItemModel(self)
+        if items:
+            self.model.appendColumn(items)
+
+        self.list_view = QListView()
+        self.list_view.setModel(self.model)
+        self.list_view.setDragDropMode(QAbstractItemView.InternalMove)
+        self.list_view.setDefaultDropAction(Qt.MoveAction)
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setLayoutMode(QListView.Batched)
+        self.list_view.setBatchSize(200)
+
+        layout.addWidget(self.list_view)
 
         button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
         button_box.accepted.connect(self.accept)
@@ -69,114 +91,345 @@ class FileSelectionDialog(QDialog):
         Returns:
             list[str]: An ordered list of the selected file names.
         """
-        selected_files = []
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            if item.checkState() == Qt.Checked:
-                selected_files.append(item.text())
-        return selected_files
+        model = self.model
+        items = (model.item(i) for i in range(model.rowCount()))
+        return [item.text() for item in items if item.checkState() == Qt.Checked]
+
+# --- Chunk Model for Selection Dialog ---
+class ChunkListModel(QAbstractListModel):
+    """A list model holding conversation chunks and their selection state.
 
-# --- Chunk Widget for Selection Dialog ---
-class ChunkWidgetItem(QWidget):
-    """A custom widget to display a single conversation chunk in the selection dialog.
+    Each row is one chunk. Besides the display title, the model exposes
+    text previews and the three check states of a row (the whole chunk, the
+    user part and the model part) through custom roles. The check states are
+    kept in plain Python lists so bulk updates cost a single `dataChanged`.
 
-    This widget includes a main checkbox to include/exclude the entire chunk,
-    and sub-checkboxes to include/exclude the user and model parts individually.
-    It also shows a preview of the text content.
+    Chunks are pulled from their source in batches: the first batch when the
+    model is created, the rest through `fetchMore` as the view scrolls down,
+    or all at once with `fetch_all` when every row is needed.
 
     Attributes:
-        main_check (QCheckBox): The primary checkbox to toggle the whole chunk.
-        user_check (QCheckBox): Checkbox to include the user's message.
-        model_check (QCheckBox): Checkbox to include the model's response.
+        chunks (list[dict]): The chunks fetched so far.
+        main_checked (list[bool]): Whether each chunk is included at all.
+        user_checked (list[bool]): Whether each chunk's user message is included.
+        model_checked (list[bool]): Whether each chunk's model response is included.
     """
-    def __init__(self, chunk_number, user_text, model_text, has_image, parent=None):
-        """Initializes the ChunkWidgetItem.
+    UserPreviewRole = Qt.UserRole + 1
+    ModelPreviewRole = Qt.UserRole + 2
+    MainCheckRole = Qt.UserRole + 3
+    UserCheckRole = Qt.UserRole + 4
+    ModelCheckRole = Qt.UserRole + 5
+
+    # Upper bound on the text handed to the delegate, which elides it to fit.
+    PREVIEW_CHARS = 300
+    # How many chunks are pulled from the source per fetch.
+    FETCH_BATCH = 200
+
+    def __init__(self, chunks, parent=None):
+        """Initializes the ChunkListModel with every part of every chunk checked.
 
         Args:
-            chunk_number (int): The sequential number of the chunk.
-            user_text (str): The text from the user's part of the conversation.
-            model_text (str): The text from the model's part of the conversation.
-            has_image (bool): True if the model's response includes an image.
-            parent (QWidget, optional): The parent widget. Defaults to None.
+            chunks (iterable[dict]): The conversation chunks; may be a
+                generator that parses them as they are fetched.
+            parent (QObject, optional): The parent object. Defaults to None.
         """
         super().__init__(parent)
-        self.raw_user_text = user_text # Store raw text for smart filtering
-        self.layout = QVBoxLayout(self)
-        self.layout.setContentsMargins(10, 10, 10, 10)
-
-        # --- Main Checkbox and Title ---
-        title_layout = QHBoxLayout()
-        title = f"Chunk {chunk_number}"
-        if has_image:
-            title += " (Image)"
-        self.main_check = QCheckBox(title)
-        self.main_check.setChecked(True)
-        self.main_check.stateChanged.connect(self.toggle_sub_checks)
-        title_layout.addWidget(self.main_check)
-        self.layout.addLayout(title_layout)
-
-        # --- Sub-checkboxes and Text Previews ---
-        self.user_check = QCheckBox("Include User")
-        self.user_check.setChecked(True)
-        self.user_text_preview = QLabel(f"<i>User:</i> {user_text[:100]}...")
-        self.user_text_preview.setWordWrap(True)
-        self.user_text_preview.setVisible(bool(user_text))
-
-        self.model_check = QCheckBox("Include Model")
-        self.model_check.setChecked(True)
-        self.model_text_preview = QLabel(f"<i>Model:</i> {model_text[:100]}...")
-        self.model_text_preview.setWordWrap(True)
-        self.model_text_preview.setVisible(bool(model_text or has_image)) # Show if text or image
-
-        sub_layout = QVBoxLayout()
-        sub_layout.setContentsMargins(20, 0, 0, 0)
-        sub_layout.addWidget(self.user_check)
-        sub_layout.addWidget(self.user_text_preview)
-        sub_layout.addWidget(self.model_check)
-        sub_layout.addWidget(self.model_text_preview)
-        self.layout.addLayout(sub_layout)
-
-    def toggle_sub_checks(self, state):
-        """Enables or disables sub-checkboxes based on the main checkbox's state.
+        self.chunks = []
+        self.main_checked = []
+        self.user_checked = []
+        self.model_checked = []
+        self._check_lists = {
+            self.MainCheckRole: self.main_checked,
+            self.UserCheckRole: self.user_checked,
+            self.ModelCheckRole: self.model_checked,
+        }
+        # Previews are built the first time a row is shown, then reused.
+        self._previews = {}
+        self._source = iter(chunks)
+        self._fetch(self.FETCH_BATCH)
 
-        Args:
-            state (int): The Qt.CheckState of the main checkbox.
-        """
-        is_checked = state == Qt.Checked
-        self.user_check.setEnabled(is_checked)
-        self.model_check.setEnabled(is_checked)
+    def rowCount(self, parent=QModelIndex()):
+        """Returns the number of chunks fetched so far."""
+        return 0 if parent.isValid() else len(self.chunks)
 
-    def get_selection(self):
-        """Gets the user's selection for this chunk.
+    def canFetchMore(self, parent=QModelIndex()):
+        """Returns whether the source may still hold chunks."""
+        return not parent.isValid() and self._source is not None
 
-        Returns:
-            dict or None: A dictionary with 'include_user' and 'include_model'
-            booleans if the main checkbox is checked, otherwise None.
+    def fetchMore(self, parent=QModelIndex()):
+        """Appends the next batch of chunks; called by the view as it scrolls."""
+        if not parent.isValid():
+            self._fetch(self.FETCH_BATCH)
+
+    def fetch_all(self):
+        """Appends every chunk that has not been fetched yet."""
+        self._fetch(None)
+
+    def _fetch(self, count):
+        """Pulls up to `count` chunks (all of them if None) from the source.
+
+        New rows start with every part checked.
         """
-        if not self.main_check.isChecked():
+        if self._source is None:
+            return
+        try:
+            batch = list(itertools.islice(self._source, count))
+        except Exception:
+            self._source = None  # A broken source cannot be resumed
+            raise
+        if count is None or len(batch) < count:
+            self._source = None
+        if not batch:
+            return
+        first = len(self.chunks)
+        self.beginInsertRows(QModelIndex(), first, first + len(batch) - 1)
+        self.chunks.extend(batch)
+        for checks in self._check_lists.values():
+            checks.extend([True] * len(batch))
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.DisplayRole):
+        """Returns the title, a preview or a check state for a chunk."""
+        if not index.isValid():
             return None
-        return {
-            "include_user": self.user_check.isChecked(),
-            "include_model": self.model_check.isChecked()
-        }
+        row = index.row()
+        chunk = self.chunks[row]
+        if role == Qt.DisplayRole:
+            title = f"Chunk {row + 1}"
+            if "model_image" in chunk:
+                title += " (Image)"
+            return title
+        if role == self.UserPreviewRole or role == self.ModelPreviewRole:
+            key = (row, role)
+            preview = self._previews.get(key)
+            if preview is None:
+                if role == self.UserPreviewRole:
+                    preview = self._preview(chunk.get("user_text", ""))
+                else:
+                    preview = self._preview(chunk.get("model_text", ""))
+                    # Show the preview line if there is text or an image
+                    preview = preview or ("[Image]" if "model_image" in chunk else "")
+                self._previews[key] = preview
+            return preview
+        if role in self._check_lists:
+            return self._check_lists[role][row]
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        """Sets one of the three check states of a chunk."""
+        if not index.isValid() or role not in self._check_lists:
+            return False
+        self._check_lists[role][index.row()] = bool(value)
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def flags(self, index):
+        """Rows are enabled but not selectable; the delegate handles clicks."""
+        return Qt.ItemIsEnabled if index.isValid() else Qt.NoItemFlags
+
+    def set_check_states(self, main_checked=None, user_checked=None, model_checked=None):
+        """Replaces check states for all rows at once.
+
+        Each argument is either None (leave unchanged), a bool applied to
+        every row, or a list with one bool per row. Views are notified with
+        a single `dataChanged` signal.
+
+        Args:
+            main_checked (bool or list[bool], optional): New whole-chunk states.
+            user_checked (bool or list[bool], optional): New user-part states.
+            model_checked (bool or list[bool], optional): New model-part states.
+        """
+        count = len(self.chunks)
+        if not count:
+            return
+        for role, values in ((self.MainCheckRole, main_checked),
+                             (self.UserCheckRole, user_checked),
+                             (self.ModelCheckRole, model_checked)):
+            if values is None:
+                continue
+            if isinstance(values, bool):
+                values = [values] * count
+            self._check_lists[role][:] = values
+        self.dataChanged.emit(self.index(0), self.index(count - 1))
+
+    @classmethod
+    def _preview(cls, text):
+        """Returns the start of a text, collapsed onto a single line."""
+        return " ".join(text[:cls.PREVIEW_CHARS].split())
+
+# --- Chunk Delegate for Selection Dialog ---
+class ChunkItemDelegate(QStyledItemDelegate):
+    """Paints a chunk row and toggles its check states on click.
+
+    Each row shows a main checkbox with the chunk title, followed by an
+    indented "Include User" checkbox, the user preview, an "Include Model"
+    checkbox and the model preview. The sub-checkboxes are disabled while the
+    main checkbox is unchecked. Nothing is instantiated per row, so only the
+    rows scrolled into view cost any work.
+
+    Preview lines are drawn as plain text with an italic prefix. The italic
+    font, its metrics and the elided preview strings are cached, so repaints
+    while scrolling do not re-measure text.
+    """
+    MARGIN = 10
+    INDENT = 20
+    LINE_COUNT = 5
+
+    _CHECK_LINES = (
+        (0, ChunkListModel.MainCheckRole),
+        (1, ChunkListModel.UserCheckRole),
+        (3, ChunkListModel.ModelCheckRole),
+    )
+    _PREVIEW_LINES = (
+        (2, "User:", ChunkListModel.UserPreviewRole),
+        (4, "Model:", ChunkListModel.ModelPreviewRole),
+    )
+
+    def __init__(self, parent=None):
+        """Initializes the ChunkItemDelegate.
+
+        Args:
+            parent (QObject, optional): The parent object. Defaults to None.
+        """
+        super().__init__(parent)
+        self._font_key = None
+        self._prefix_font = None
+        self._prefix_metrics = None
+        self._elided_width = None
+        self._elided_cache = {}
+
+    def _prefix_font_for(self, option):
+        """Returns the shared italic prefix font and its metrics for a row font."""
+        font_key = option.font.key()
+        if font_key != self._font_key:
+            self._font_key = font_key
+            self._prefix_font = QFont(option.font)
+            self._prefix_font.setItalic(True)
+            self._prefix_metrics = QFontMetrics(self._prefix_font)
+            self._elided_cache.clear()
+        return self._prefix_font, self._prefix_metrics
+
+    def _elided(self, option, index, role, width):
+        """Returns a preview elided to a width, cached until the width changes."""
+        if width != self._elided_width:
+            self._elided_width = width
+            self._elided_cache.clear()
+        key = (index.row(), role)
+        text = self._elided_cache.get(key)
+        if text is None:
+            text = option.fontMetrics.elidedText(index.data(role), Qt.ElideRight, width)
+            self._elided_cache[key] = text
+        return text
+
+    def _line_height(self, option):
+        """Returns the height of one line of the row."""
+        return option.fontMetrics.height() + 6
+
+    def _line_rect(self, option, line):
+        """Returns the rectangle of a line within the row."""
+        line_height = self._line_height(option)
+        indent = 0 if line == 0 else self.INDENT
+        return QRect(
+            option.rect.left() + self.MARGIN + indent,
+            option.rect.top() + self.MARGIN // 2 + line * line_height,
+            option.rect.width() - 2 * self.MARGIN - indent,
+            line_height
+        )
+
+    def _check_option(self, option, index, line, role):
+        """Builds the style option for one of the row's checkboxes."""
+        check_option = QStyleOptionButton()
+        check_option.rect = self._line_rect(option, line)
+        check_option.fontMetrics = option.fontMetrics
+        check_option.palette = option.palette
+        if role == ChunkListModel.MainCheckRole:
+            check_option.text = index.data(Qt.DisplayRole)
+        elif role == ChunkListModel.UserCheckRole:
+            check_option.text = "Include User"
+        else:
+            check_option.text = "Include Model"
+        enabled = role == ChunkListModel.MainCheckRole or index.data(ChunkListModel.MainCheckRole)
+        check_option.state = QStyle.State_On if index.data(role) else QStyle.State_Off
+        if enabled:
+            check_option.state |= QStyle.State_Enabled
+        return check_option
+
+    def sizeHint(self, option, index):
+        """Returns a fixed row height that fits all five lines."""
+        return QSize(option.rect.width(), self.LINE_COUNT * self._line_height(option) + self.MARGIN)
+
+    def paint(self, painter, option, index):
+        """Draws the checkboxes and previews of a chunk row."""
+        widget = option.widget
+        style = widget.style() if widget else QApplication.style()
+        painter.save()
+
+        for line, role in self._CHECK_LINES:
+            style.drawControl(QStyle.CE_CheckBox, self._check_option(option, index, line, role), painter, widget)
+
+        prefix_font, prefix_metrics = self._prefix_font_for(option)
+        for line, prefix, role in self._PREVIEW_LINES:
+            if not index.data(role):
+                continue
+            rect = self._line_rect(option, line)
+            painter.setFont(prefix_font)
+            painter.drawText(rect, Qt.AlignLeft | Qt.AlignVCenter, prefix)
+            prefix_width = prefix_metrics.horizontalAdvance(prefix + " ")
+            text_rect = rect.adjusted(prefix_width, 0, 0, 0)
+            painter.setFont(option.font)
+            painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignVCenter,
+                             self._elided(option, index, role, text_rect.width()))
+
+        # Separator between rows
+        painter.setPen(option.palette.mid().color())
+        painter.drawLine(option.rect.bottomLeft(), option.rect.bottomRight())
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        """Toggles the checkbox under the mouse, or the main one on Space."""
+        if event.type() == QEvent.KeyPress and event.key() == Qt.Key_Space:
+            role = ChunkListModel.MainCheckRole
+            return model.setData(index, not index.data(role), role)
+
+        if event.type() not in (QEvent.MouseButtonPress, QEvent.MouseButtonRelease, QEvent.MouseButtonDblClick):
+            return False
+        if event.button() != Qt.LeftButton:
+            return False
+
+        widget = option.widget
+        style = widget.style() if widget else QApplication.style()
+        position = event.position().toPoint()
+        for line, role in self._CHECK_LINES:
+            check_option = self._check_option(option, index, line, role)
+            click_rect = style.subElementRect(QStyle.SE_CheckBoxClickRect, check_option, widget)
+            if not click_rect.contains(position):
+                continue
+            if not check_option.state & QStyle.State_Enabled:
+                return True
+            if event.type() == QEvent.MouseButtonRelease:
+                model.setData(index, not index.data(role), role)
+            return True
+        return False
 
 # --- Chunk Selection Dialog ---
 class ChunkSelectionDialog(QDialog):
     """A dialog for selecting which conversation chunks from a file to include in the PDF.
 
-    This dialog displays a scrollable list of `ChunkWidgetItem` instances, allowing
-    the user to make fine-grained selections. It also includes a feature to
-    select all chunks from a certain number onwards.
+    This dialog displays the chunks in a virtualized `QListView` backed by a
+    `ChunkListModel` and painted by a `ChunkItemDelegate`, allowing the user
+    to make fine-grained selections without creating widgets per chunk. It
+    also includes a feature to select all chunks from a certain number onwards.
 
     Attributes:
-        chunks (list[dict]): The raw chunk data from the processed file.
-        chunk_widgets (list[ChunkWidgetItem]): The list of widget instances created.
+        model (ChunkListModel): The model holding the chunks and their selection state.
+        view (QListView): The view displaying the chunks.
     """
     def __init__(self, chunks, file_name, parent=None):
         """Initializes the ChunkSelectionDialog.
 
         Args:
-            chunks (list[dict]): A list of conversation chunks.
+            chunks (iterable[dict]): The conversation chunks; a generator is
+                consumed only as far as the list is scrolled.
             file_name (str): The name of the file being processed.
             parent (QWidget, optional): The parent widget. Defaults to None.
         """
@@ -184,9 +437,6 @@ class ChunkSelectionDialog(QDialog):
         self.setWindowTitle(f"Select Chunks for: {file_name}")
         self.setGeometry(150, 150, 800, 700)
 
-        self.chunks = chunks
-        self.chunk_widgets = []
-
         main_layout = QVBoxLayout(self)
 
         # --- "Start From" Feature ---
@@ -209,28 +459,23 @@ class ChunkSelectionDialog(QDialog):
 
         main_layout.addLayout(start_from_layout)
 
-        # --- Scroll Area for Chunks ---
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_content = QWidget()
-        self.list_layout = QVBoxLayout(scroll_content)
-        scroll_area.setWidget(scroll_content)
-        main_layout.addWidget(scroll_area)
-
-        # --- Populate with Chunk Widgets ---
-        for i, chunk in enumerate(self.chunks):
-            widget = ChunkWidgetItem(
-                i + 1,
-                chunk.get("user_text", ""),
-                chunk.get("model_text", ""),
-                "model_image" in chunk
-            )
-            self.list_layout.addWidget(widget)
-            self.chunk_widgets.append(widget)
+        # --- Virtualized List of Chunks ---
+        # Rows are painted on demand, so only the visible chunks cost any work,
+        # and chunks are only parsed once the list is scrolled near them.
+        self.model = ChunkListModel(chunks, self)
+        self.view = QListView()
+        self.view.setModel(self.model)
+        self.view.setItemDelegate(ChunkItemDelegate(self.view))
+        self.view.setSelectionMode(QAbstractItemView.NoSelection)
+        self.view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        # Every row has the same height, so the view can lay out the whole
+        # list from a single size hint instead of asking each row.
+        self.view.setUniformItemSizes(True)
+        main_layout.addWidget(self.view)
 
         # Default: Uncheck the first user message (often just pasted text)
-        if self.chunk_widgets:
-            self.chunk_widgets[0].user_check.setChecked(False)
+        if self.model.chunks:
+            self.model.setData(self.model.index(0), False, ChunkListModel.UserCheckRole)
 
         # --- Dialog Buttons ---
         button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
@@ -242,22 +487,21 @@ class ChunkSelectionDialog(QDialog):
         """Checks all chunks from the specified number onwards."""
         try:
             start_num = int(self.start_from_edit.text())
-            for i, widget in enumerate(self.chunk_widgets):
-                is_checked = (i + 1) >= start_num
-                widget.main_check.setChecked(is_checked)
+            # Chunks fetched later would start checked, so fetch them all now.
+            self.model.fetch_all()
+            self.model.set_check_states(
+                main_checked=[(i + 1) >= start_num for i in range(len(self.model.chunks))],
                 # Also reset sub-checks to their default state
-                widget.user_check.setChecked(True)
-                widget.model_check.setChecked(True)
+                user_checked=True,
+                model_checked=True
+            )
 
         except ValueError:
             QMessageBox.warning(self, "Invalid Input", "Please enter a valid number.")
 
     def apply_select_all(self):
         """Checks all chunks and all sub-boxes."""
-        for widget in self.chunk_widgets:
-            widget.main_check.setChecked(True)
-            widget.user_check.setChecked(True)
-            widget.model_check.setChecked(True)
+        self.model.set_check_states(main_checked=True, user_checked=True, model_checked=True)
 
     def apply_model_only(self):
         """Smart filter: Hides short generic acknowledgments, correction requests, and keeps meaningful content."""
@@ -293,23 +537,27 @@ class ChunkSelectionDialog(QDialog):
         ).lower()
         template_normalized = re.sub(r'\s+', ' ', rectify_template).strip()
         
-        total_widgets = len(self.chunk_widgets)
-        for i, widget in enumerate(self.chunk_widgets):
-            widget.main_check.setChecked(True)
-            widget.model_check.setChecked(True)
-            
+        # The rules look at every chunk, including the last one
+        self.model.fetch_all()
+        chunks = self.model.chunks
+
+        # Compute the new states in plain lists and push them to the model once
+        total_chunks = len(chunks)
+        user_checked = [True] * total_chunks
+        model_checked = [True] * total_chunks
+        for i in range(total_chunks):
             # Rule 1: Always keep the LAST message (concluding remarks)
-            if i == total_widgets - 1:
-                widget.user_check.setChecked(True)
+            if i == total_chunks - 1:
+                user_checked[i] = True
                 continue
 
             # Rule 2: Always UNCHECK the first user message
             if i == 0:
-                widget.user_check.setChecked(False)
+                user_checked[i] = False
                 continue
 
             # Rule 3: Fuzzy Template Matching for Rectification Requests
-            user_text_raw = widget.raw_user_text.lower()
+            user_text_raw = chunks[i].get("user_text", "").lower()
             user_text_normalized = re.sub(r'\s+', ' ', user_text_raw).strip()
             
             # Compare first 800 chars of normalized text to avoid the variable "Lines" section
@@ -318,10 +566,10 @@ class ChunkSelectionDialog(QDialog):
             if match_ratio > 0.85:
                 # This is a rectification request!
                 # 1. Uncheck this user message
-                widget.user_check.setChecked(False)
+                user_checked[i] = False
                 # 2. Uncheck the PREVIOUS model response (because it was wrong)
                 if i > 0:
-                    self.chunk_widgets[i-1].model_check.setChecked(False)
+                    model_checked[i-1] = False
                 continue
             
             # Rule 4: Length and Content based filtering for acknowledgments
@@ -336,38 +584,48 @@ class ChunkSelectionDialog(QDialog):
                 if any(pattern in clean_text for pattern in ack_patterns):
                     is_generic_ack = True
             
-            if is_generic_ack:
-                widget.user_check.setChecked(False)
-            else:
-                widget.user_check.setChecked(True)
+            user_checked[i] = not is_generic_ack
+
+        self.model.set_check_states(main_checked=True, user_checked=user_checked, model_checked=model_checked)
 
     def get_selected_chunks(self):
-        """Constructs a list of selected chunks based on the user's choices.
+        """Returns the selected chunks, annotated with the user's choices.
+
+        The chunks are marked in place with `include_user` and
+        `include_model` and returned as they are, so no copies are made.
 
         Returns:
             list[dict]: A list of chunk dictionaries, formatted for the PDF
-            worker. Each dictionary includes the original text/image data
+            worker. Each dictionary holds the original text/image data
             plus the user's include/exclude choices.
         """
         selected = []
-        for i, widget in enumerate(self.chunk_widgets):
-            selection_state = widget.get_selection()
-            if selection_state:
-                original_chunk = self.chunks[i]
-                new_chunk = {
-                    "user_text": original_chunk.get("user_text", ""),
-                    "model_text": original_chunk.get("model_text", ""),
-                    "include_user": selection_state["include_user"],
-                    "include_model": selection_state["include_model"]
-                }
-                if "model_image" in original_chunk:
-                    new_chunk["model_image"] = original_chunk["model_image"]
-                selected.append(new_chunk)
+        model = self.model
+        model.fetch_all()  # Chunks never scrolled to are still included
+        rows = zip(model.chunks, model.main_checked, model.user_checked, model.model_checked)
+        for chunk, main_checked, include_user, include_model in rows:
+            if main_checked:
+                chunk["include_user"] = include_user
+                chunk["include_model"] = include_model
+                selected.append(chunk)
         return selected
 
-# --- Communication object for worker thread ---
+def chunk_has_content(chunk):
+    """Checks whether a selected chunk would produce anything on a page.
+
+    Args:
+        chunk (dict): A chunk as returned by `ChunkSelectionDialog.get_selected_chunks`.
+
+    Returns:
+        bool: True if an included part has text or an image.
+    """
+    if chunk.get("include_user") and chunk.get("user_text"):
+        return True
+    return bool(chunk.get("include_model") and (chunk.get("model_text") or chunk.get("model_image")))
+
+# --- Communication object for the PDF worker ---
 class WorkerSignals(QObject):
-    """Defines the signals available from a running worker thread.
+    """Defines the signals relayed from the PDF worker process.
 
     Attributes:
         finished (Signal): Emits a string message on completion or error.
@@ -376,152 +634,127 @@ class WorkerSignals(QObject):
     finished = Signal(str)
     progress = Signal(str)
 
-class PdfWorker(QObject):
-    """Worker thread for creating and merging PDFs to keep the UI responsive.
+class PdfWorkerRelay(QRunnable):
+    """Relays status events from the PDF worker process to the UI.
 
-    This worker processes tasks from a queue in a separate thread, emitting
-    signals to update the UI without freezing it.
+    The PDF work itself runs in a separate process (see `pdf_worker`), so it
+    never competes with the UI for the GIL. This runnable blocks on the
+    process's event queue on a `QThreadPool` thread and re-emits each event
+    as a signal.
 
     Attributes:
         signals (WorkerSignals): An object containing signals for communication.
-        task_queue (queue.Queue): The queue from which to fetch PDF generation tasks.
-        is_running (bool): A flag to control the execution loop.
+        event_queue (multiprocessing.Queue): The queue the worker process
+            reports to.
     """
-    def __init__(self, task_queue):
-        """Initializes the PdfWorker.
+    def __init__(self, event_queue):
+        """Initializes the PdfWorkerRelay.
 
         Args:
-            task_queue (queue.Queue): The queue to process tasks from.
+            event_queue (multiprocessing.Queue): The queue to read events from.
         """
         super().__init__()
         self.signals = WorkerSignals()
-        self.task_queue = task_queue
-        self.is_running = True
+        self.event_queue = event_queue
 
     def run(self):
-        """The main execution loop for the worker thread.
+        """Forwards events until the worker process sends its final None."""
+        for kind, message in iter(self.event_queue.get, None):
+            if kind == "progress":
+                self.signals.progress.emit(message)
+            else:
+                self.signals.finished.emit(message)
 
-        Continuously fetches tasks from the queue and processes them.
-        Handles PDF page creation for recovery info and conversation chunks,
-        then merges them into the main PDF. Exits when `is_running` is False.
-        """
-        while self.is_running:
-            try:
-                task = self.task_queue.get(timeout=1)
-                if task is None:  # Sentinel value to stop
-                    self.is_running = False
-                    continue
+# --- Folder import ---
+class FolderScanSignals(QObject):
+    """Defines the signals available from a running folder scan.
 
-                chunks, main_pdf_path, show_headings, user_heading, model_heading, recovery_info = task
-
-                # --- Load Latest Mapping ---
-                mappings_dir = "mappings"
-                latest_mapping = []
-                if os.path.exists(mappings_dir):
-                    mapping_files = [f for f in os.listdir(mappings_dir) if f.startswith("mapping_") and f.endswith(".json")]
-                    if mapping_files:
-                        latest_mapping_file = sorted(mapping_files)[-1]
-                        try:
-                            with open(os.path.join(mappings_dir, latest_mapping_file), 'r', encoding='utf-8') as f:
-                                latest_mapping = json.load(f)
-                        except Exception as e:
-                            print(f"Error loading mapping: {e}")
-
-                # --- Handle Recovery Info ---
-                if recovery_info:
-                    self.signals.progress.emit(f"Creating recovery page for {recovery_info.get('export_file_name', 'file')}...")
-                    recovery_page_path = "_temp_recovery_page.pdf"
-                    create_pdf_page(
-                        user_text="", model_text="",
-                        output_path=recovery_page_path,
-                        recovery_info=recovery_info
-                    )
-                    merge_pdfs(main_pdf_path, recovery_page_path)
-
-                # --- Process Chunks ---
-                total_chunks = len(chunks)
-                for i, chunk in enumerate(chunks):
-                    self.signals.progress.emit(f"Processing chunk {i + 1}/{total_chunks} for {recovery_info.get('export_file_name', 'file')}...")
-                    user_text = chunk.get("user_text", "") if chunk.get("include_user", False) else ""
-                    model_text = chunk.get("model_text", "") if chunk.get("include_model", False) else ""
-                    
-                    # Handle multiple images (existing + supplemental)
-                    model_images = []
-                    if chunk.get("include_model", False):
-                        # Add existing image from export if any
-                        existing_img = chunk.get("model_image")
-                        if existing_img:
-                            model_images.append(existing_img)
-                        
-                        # Add supplemental images via fuzzy matching
-                        if model_text and latest_mapping:
-                            for item in latest_mapping:
-                                snippet = item.get("text_snippet", "")
-                                if not snippet: continue
-                                
-                                # Use ratio for fuzzy match
-                                ratio = difflib.SequenceMatcher(None, model_text, snippet).ratio()
-                                if ratio > 0.9: # High confidence match
-                                    img_objs = item.get("images", [])
-                                    # Fallback for old formats
-                                    if not img_objs:
-                                        img_paths = item.get("image_paths", [])
-                                        if not img_paths and item.get("image_path"):
-                                            img_paths = [item.get("image_path")]
-                                        img_objs = [{"path": p, "desc": ""} for p in img_paths]
-                                    
-                                    for img_obj in img_objs:
-                                        img_path = img_obj.get("path")
-                                        img_desc = img_obj.get("desc", "")
-                                        if img_path and os.path.exists(img_path):
-                                            try:
-                                                with open(img_path, "rb") as f:
-                                                    data = base64.b64encode(f.read()).decode('utf-8')
-                                                    model_images.append({
-                                                        "mimeType": "image/png",
-                                                        "data": data,
-                                                        "description": img_desc
-                                                    })
-                                            except Exception as e:
-                                                print(f"Error reading supplemental image: {e}")
-
-                    user_response_num = chunk.get("user_response_num")
-                    model_response_num = chunk.get("model_response_num")
-
-                    if not user_text and not model_text and not model_images:
-                        continue
-
-                    temp_page_path = "_temp_page.pdf"
-                    create_pdf_page(
-                        user_text=user_text, model_text=model_text,
-                        model_images=model_images, output_path=temp_page_path,
-                        show_headings=show_headings, user_heading=user_heading,
-                        model_heading=model_heading, user_response_num=user_response_num,
-                        model_response_num=model_response_num, recovery_info=None
-                    )
-                    merge_pdfs(main_pdf_path, temp_page_path)
+    Attributes:
+        file_parsed (Signal): Emits the file name, file path and the chunks
+            of a file, as an iterator that parses them as it is consumed.
+        file_failed (Signal): Emits the file name and the error message of a
+            file that could not be parsed.
+        finished (Signal): Emits once every file has been handled.
+        progress (Signal): Emits a string message for progress updates.
+    """
+    file_parsed = Signal(str, str, object)
+    file_failed = Signal(str, str)
+    finished = Signal()
+    progress = Signal(str)
+
+class FolderScanWorker(QRunnable):
+    """Worker that parses the files of a folder import off the UI thread.
+
+    Files are parsed in order and each result is emitted as soon as it is
+    ready, so the user can review one file while the next is being parsed.
+    The scan stays at most `max_ahead` files ahead of the review; the UI
+    calls `file_consumed` as it takes each file, so parsed chunks never
+    pile up in memory for a large folder.
+
+    Attributes:
+        signals (FolderScanSignals): An object containing signals for communication.
+        folder_path (str): The folder containing the files.
+        file_names (list[str]): The files to parse, in order.
+        platform_name (str): The chat platform used to pick the parser.
+        is_running (bool): A flag to stop the scan early.
+    """
+    def __init__(self, folder_path, file_names, platform_name, max_ahead=2):
+        """Initializes the FolderScanWorker.
 
-                self.task_queue.task_done()
+        Args:
+            folder_path (str): The folder containing the files.
+            file_names (list[str]): The files to parse, in order.
+            platform_name (str): The chat platform used to pick the parser.
+            max_ahead (int, optional): How many parsed files may wait for
+                review. Defaults to 2.
+        """
+        super().__init__()
+        self.signals = FolderScanSignals()
+        self.folder_path = folder_path
+        self.file_names = file_names
+        self.platform_name = platform_name
+        self.is_running = True
+        self._slots = threading.Semaphore(max_ahead)
 
-            except queue.Empty:
-                continue # Just check is_running again
+    def run(self):
+        """Parses each file and emits its chunks or its error."""
+        for file_name in self.file_names:
+            self._slots.acquire()  # Wait until the review catches up
+            if not self.is_running:
+                break
+            file_path = os.path.join(self.folder_path, file_name)
+            self.signals.progress.emit(f"Reading {file_name}...")
+            chunks = process_conversation_file(file_path, self.platform_name)
+            try:
+                # Reading and decoding the file happens on the first chunk, so
+                # pull it here; the rest is built as the review scrolls.
+                first_chunk = next(chunks, None)
             except Exception as e:
-                self.signals.finished.emit(f"Error: {e}")
-                self.task_queue.task_done()
+                self.signals.file_failed.emit(file_name, str(e))
+                continue
+            if first_chunk is None:
+                self.signals.file_failed.emit(file_name, "No conversation chunks found.")
+                continue
+            self.signals.file_parsed.emit(file_name, file_path, itertools.chain((first_chunk,), chunks))
+        self.signals.finished.emit()
 
-        self.signals.finished.emit("All tasks completed successfully!")
+    def file_consumed(self):
+        """Lets the scan parse one more file; called as each file is taken for review."""
+        self._slots.release()
 
     def stop(self):
-        """Stops the worker thread's execution loop."""
+        """Stops the scan before the next file."""
         self.is_running = False
+        self._slots.release()  # Wake the scan if it is waiting on the review
 
 # --- Main Application Window ---
 class MainWindow(QMainWindow):
     """The main application window for the Conversation Archiver.
 
     This class sets up the entire GUI, manages user interactions, handles
-    configuration saving/loading, and coordinates the background PDF
-    generation tasks with the `PdfWorker`.
+    configuration saving/loading, and coordinates background PDF generation:
+    tasks are sent to the PDF worker process, and a `PdfWorkerRelay` brings
+    its status events back to the UI thread.
     """
     def __init__(self):
         """Initializes the MainWindow, sets up the UI, and connects signals."""
@@ -637,13 +870,32 @@ class MainWindow(QMainWindow):
         bottom_layout.addWidget(self.status_label)
         main_layout.addLayout(bottom_layout)
 
-        # --- Worker Thread and Queue Setup ---
-        self.task_queue = queue.Queue()
-        self.worker = PdfWorker(self.task_queue)
-        self.thread = threading.Thread(target=self.worker.run, daemon=True)
-        self.worker.signals.progress.connect(self.update_status)
-        self.worker.signals.finished.connect(self.on_processing_finished)
-        self.thread.start()
+        # --- Worker Process and Queue Setup ---
+        # PDF generation runs in its own process, so it never competes with
+        # the UI for the GIL. Its status events are relayed by a Qt-managed
+        # pool thread and delivered to the UI thread through queued
+        # connections. The worker is always spawned, never forked: a fork
+        # would copy this already multithreaded Qt process, locks and all.
+        mp_context = multiprocessing.get_context("spawn")
+        self.task_queue = mp_context.Queue()
+        self.event_queue = mp_context.Queue()
+        self.stop_event = mp_context.Event()
+        self.pdf_process = mp_context.Process(
+            target=pdf_worker_main,
+            args=(self.task_queue, self.event_queue, self.stop_event),
+            daemon=True
+        )
+        self.pdf_process.start()
+        self.worker = PdfWorkerRelay(self.event_queue)
+        self.worker.setAutoDelete(False)  # We keep the reference until shutdown
+        self.worker.signals.progress.connect(self.update_status, Qt.QueuedConnection)
+        self.worker.signals.finished.connect(self.on_processing_finished, Qt.QueuedConnection)
+        self.thread_pool = QThreadPool.globalInstance()
+        # The relay holds one pool thread for the app's lifetime, so leave
+        # room for the folder scan worker even on single-core machines.
+        self.thread_pool.setMaxThreadCount(max(2, self.thread_pool.maxThreadCount()))
+        self.thread_pool.start(self.worker)
+        self.folder_scan_worker = None
 
         self.configs = {}
         self.config_file = "configs.json"
@@ -651,10 +903,25 @@ class MainWindow(QMainWindow):
         self._populate_configs_combo()
 
         # --- Validation Signal Connections ---
-        self.chat_platform_combo.currentTextChanged.connect(self._update_batch_button_state)
-        self.chat_link_entry.textChanged.connect(self._update_batch_button_state)
-        self.chat_account_entry.textChanged.connect(self._update_batch_button_state)
-        self.md_file_name_label.textChanged.connect(self._update_batch_button_state)
+        # Edits restart a short single-shot timer, so a burst of keystrokes
+        # or a large paste is validated once rather than on every change.
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(50)
+        self._validate_timer.timeout.connect(self._update_batch_button_state)
+        self.chat_platform_combo.currentTextChanged.connect(self._validate_timer.start)
+        self.chat_link_entry.textChanged.connect(self._validate_timer.start)
+        self.chat_account_entry.textChanged.connect(self._validate_timer.start)
+        self.md_file_name_label.textChanged.connect(self._validate_timer.start)
+
+        # --- Status Updates ---
+        # Workers can report progress for every file or page; the label is
+        # updated at most every 100 ms and always ends on the latest message.
+        self._pending_status = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(100)
+        self._status_timer.timeout.connect(self._flush_status)
 
         # Set initial state
         self._update_batch_button_state()
@@ -664,29 +931,37 @@ class MainWindow(QMainWindow):
         """Loads all named configurations from the JSON file."""
         if os.path.exists(self.config_file):
             try:
-                with open(self.config_file, 'r') as f:
-                    self.configs = json.load(f)
-            except (json.JSONDecodeError, IOError):
+                with open(self.config_file, 'rb') as f:
+                    self.configs = load_json_bytes(f.read())
+            except (ValueError, IOError):
                 self.configs = {}  # Start fresh if file is corrupt
 
     def _save_all_configs(self):
-        """Saves all named configurations to the JSON file."""
+        """Saves all named configurations to the JSON file.
+
+        The file is written next to the target and swapped in, so a crash
+        mid-save never leaves a truncated config file behind.
+        """
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.configs, f, indent=4)
+            temp_config_file = f"{self.config_file}.tmp"
+            with open(temp_config_file, 'wb') as f:
+                f.write(dump_json_bytes(self.configs))
+            os.replace(temp_config_file, self.config_file)
         except IOError as e:
             QMessageBox.critical(self, "Error", f"Could not save configs to file: {e}")
 
     def _populate_configs_combo(self):
         """Clears and repopulates the configurations dropdown."""
-        self.config_combo.clear()
-        self.config_combo.addItem("Select a config...")  # Placeholder
-        self.config_combo.addItems(sorted(self.configs.keys()))
+        with QSignalBlocker(self.config_combo):
+            self.config_combo.clear()
+            self.config_combo.addItem("Select a config...")  # Placeholder
+            self.config_combo.addItems(sorted(self.configs.keys()))
 
     def save_configuration(self):
         """Prompts the user for a name and saves the current UI settings as a configuration."""
         config_name, ok = QInputDialog.getText(self, "Save Configuration", "Enter a name for this configuration:")
         if ok and config_name:
+            is_new = config_name not in self.configs
             self.configs[config_name] = {
                 "chat_platform": self.chat_platform_combo.currentText(),
                 "chat_account": self.chat_account_entry.text(),
@@ -696,7 +971,10 @@ class MainWindow(QMainWindow):
                 "pdf_path": self.pdf_path_label.text()
             }
             self._save_all_configs()
-            self._populate_configs_combo()
+            if is_new:
+                # Insert at its sorted position, after the placeholder.
+                row = 1 + sum(1 for name in self.configs if name < config_name)
+                self.config_combo.insertItem(row, config_name)
             self.config_combo.setCurrentText(config_name)
             QMessageBox.information(self, "Success", f"Configuration '{config_name}' saved.")
 
@@ -724,7 +1002,12 @@ class MainWindow(QMainWindow):
                 if config_name in self.configs:
                     del self.configs[config_name]
                     self._save_all_configs()
-                    self._populate_configs_combo()
+                    row = self.config_combo.findText(config_name)
+                    if row >= 0:
+                        self.config_combo.removeItem(row)
+                    # Removing the row selects a neighbour whose settings were
+                    # never loaded; go back to the placeholder instead.
+                    self.config_combo.setCurrentIndex(0)
                     QMessageBox.information(self, "Success", f"Configuration '{config_name}' deleted.")
 
     def choose_md_file(self):
@@ -738,13 +1021,15 @@ class MainWindow(QMainWindow):
 
     def _update_batch_button_state(self):
         """Enables or disables the 'Import from Folder' button based on field content."""
-        is_valid = all([
-            self.chat_platform_combo.currentText().strip(),
-            self.chat_link_entry.text().strip(),
-            self.chat_account_entry.text().strip(),
-            self.md_file_name_label.text().strip()
-        ])
-        self.import_folder_button.setEnabled(is_valid)
+        # Short-circuits on the first empty field, skipping the remaining reads.
+        is_valid = bool(
+            self.chat_platform_combo.currentText().strip()
+            and self.chat_link_entry.text().strip()
+            and self.chat_account_entry.text().strip()
+            and self.md_file_name_label.text().strip()
+        )
+        # Only one folder import runs at a time.
+        self.import_folder_button.setEnabled(is_valid and self.folder_scan_worker is None)
 
     def choose_file(self):
         """Opens a file dialog for the user to select the main destination PDF file."""
@@ -757,8 +1042,10 @@ class MainWindow(QMainWindow):
 
         This method prompts the user to select a folder, then presents the
         `FileSelectionDialog` and `ChunkSelectionDialog` to let the user
-        curate the content. It then queues all selected content for PDF
-        generation by the worker thread.
+        curate the content. The selected files are parsed by a
+        `FolderScanWorker` off the UI thread, and each one is reviewed as soon
+        as it is ready. The whole import is a single task for the PDF worker,
+        which renders each reviewed file while the next is being reviewed.
         """
         folder_path = QFileDialog.getExistingDirectory(self, "Select Folder Containing Conversation Files")
         if not folder_path:
@@ -770,13 +1057,14 @@ class MainWindow(QMainWindow):
             return
 
         try:
-            # Sort files by modification time (latest first at the bottom)
+            # Sort files by modification time (latest first at the bottom).
+            # scandir's entries carry the file type from the directory read,
+            # so only the mtime lookup costs a stat call.
             all_files_with_time = []
-            for f in os.listdir(folder_path):
-                if not f.startswith('.'):
-                    fpath = os.path.join(folder_path, f)
-                    if os.path.isfile(fpath):
-                        all_files_with_time.append((f, os.path.getmtime(fpath)))
+            with os.scandir(folder_path) as it:
+                for entry in it:
+                    if not entry.name.startswith('.') and entry.is_file():
+                        all_files_with_time.append((entry.name, entry.stat().st_mtime))
             
             # Sort ascending by time (newest at the end)
             all_files_with_time.sort(key=lambda x: x[1])
@@ -795,29 +1083,110 @@ class MainWindow(QMainWindow):
                 return
 
             self.add_button.setEnabled(False)
-            self.status_label.setText("Status: Processing folder...")
-            QApplication.processEvents() # Update UI
+            self._show_status("Status: Processing folder...")
+
+            # --- Snapshot the settings for the whole import ---
+            # The form stays editable while files are parsed, so every file
+            # is archived with the values in place when the import started.
+            self._import_recovery_base = {
+                "chat_platform": self.chat_platform_combo.currentText(),
+                "chat_link": self.chat_link_entry.text(),
+                "chat_account": self.chat_account_entry.text(),
+                "md_file_name": self.md_file_name_label.text(),
+                "md_file_location": getattr(self, 'md_full_path', ''),
+                "extra_notes": self.extra_notes_text.toPlainText()
+            }
+            self._import_pending = deque()
+            self._import_skipped = []
+            self._import_scan_done = False
+            self._import_reviewing = False
 
             # Initialize a counter for the entire batch
             # response_counter = 1
 
-            for file_name in selected_files:
-                file_path = os.path.join(folder_path, file_name)
-                self.status_label.setText(f"Status: Processing {file_name}...")
-                QApplication.processEvents()
+            # --- Begin one task for the whole import ---
+            # Reviewed files are streamed to the worker as "file" messages
+            # and the task ends with "end". The worker loads and writes the
+            # main PDF only once, and renders each file as soon as it has
+            # been reviewed.
+            self.task_queue.put((
+                "begin",
+                main_pdf_path,
+                self.show_headings_check.isChecked(),
+                self.user_heading_entry.text().strip(),
+                self.model_heading_entry.text().strip()
+            ))
+
+            # --- Parse the files off the UI thread ---
+            self.folder_scan_worker = FolderScanWorker(
+                folder_path, selected_files, self.chat_platform_combo.currentText()
+            )
+            self.folder_scan_worker.setAutoDelete(False)
+            self.folder_scan_worker.signals.file_parsed.connect(self._on_folder_file_parsed, Qt.QueuedConnection)
+            self.folder_scan_worker.signals.file_failed.connect(self._on_folder_file_failed, Qt.QueuedConnection)
+            self.folder_scan_worker.signals.finished.connect(self._on_folder_scan_finished, Qt.QueuedConnection)
+            self.folder_scan_worker.signals.progress.connect(self.update_status, Qt.QueuedConnection)
+            self._update_batch_button_state()
+            self.thread_pool.start(self.folder_scan_worker)
 
-                try:
-                    platform_name = self.chat_platform_combo.currentText()
-                    chunks = process_conversation_file(file_path, platform_name)
-                    if not chunks:
-                        QMessageBox.warning(self, "No Content", f"No conversation chunks found in {file_name}.")
-                        continue
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to read folder: {e}")
+            self._show_status("Status: Error.")
+            self.add_button.setEnabled(True)
+
+    def _on_folder_file_parsed(self, file_name, file_path, chunks):
+        """Queues a parsed file of the folder import for review.
+
+        Args:
+            file_name (str): The name of the parsed file.
+            file_path (str): The full path of the parsed file.
+            chunks (iterator[dict]): The conversation chunks found in the file.
+        """
+        self._import_pending.append((file_name, file_path, chunks, None))
+        self._review_pending_files()
 
+    def _on_folder_file_failed(self, file_name, error):
+        """Queues a file of the folder import that could not be parsed.
+
+        Args:
+            file_name (str): The name of the file.
+            error (str): The parsing error.
+        """
+        self._import_pending.append((file_name, None, None, error))
+        self._review_pending_files()
+
+    def _on_folder_scan_finished(self):
+        """Marks the folder scan as done and finishes the import once reviewed."""
+        self._import_scan_done = True
+        self._review_pending_files()
+
+    def _review_pending_files(self):
+        """Shows the `ChunkSelectionDialog` for each parsed file, in order.
+
+        Files keep being parsed while a dialog is open, and their signals are
+        delivered by the dialog's own event loop. Those calls only queue the
+        file; the outermost call shows the dialogs one after another, hands
+        each selection to the PDF worker, and ends the import once the scan
+        is done.
+        """
+        if self._import_reviewing:
+            return
+        self._import_reviewing = True
+        try:
+            while self._import_pending:
+                file_name, file_path, chunks, error = self._import_pending.popleft()
+                self.folder_scan_worker.file_consumed()
+                if error:
+                    self._import_skipped.append((file_name, error))
+                    continue
+
+                self._show_status(f"Status: Processing {file_name}...")
+                try:
                     chunk_dialog = ChunkSelectionDialog(chunks, file_name, self)
                     if not chunk_dialog.exec():
                         continue # User cancelled
 
-                    selected_chunks = chunk_dialog.get_selected_chunks()
+                    selected_chunks = [c for c in chunk_dialog.get_selected_chunks() if chunk_has_content(c)]
 
                     # Add numbering
                     # for chunk in selected_chunks:
@@ -829,49 +1198,51 @@ class MainWindow(QMainWindow):
                     #         response_counter += 1
 
                     # --- Gather Recovery Info for this specific file ---
-                    recovery_info = {
-                        "chat_platform": self.chat_platform_combo.currentText(),
-                        "chat_link": self.chat_link_entry.text(),
-                        "chat_account": self.chat_account_entry.text(),
-                        "export_file_name": file_name,
-                        "export_file_location": file_path,
-                        "md_file_name": self.md_file_name_label.text(),
-                        "md_file_location": getattr(self, 'md_full_path', ''),
-                        "extra_notes": self.extra_notes_text.toPlainText()
-                    }
-
-                    # --- Add task to the queue ---
+                    recovery_info = dict(
+                        self._import_recovery_base,
+                        export_file_name=file_name,
+                        export_file_location=file_path
+                    )
+
+                    # --- Hand the selection to the PDF worker ---
                     if selected_chunks or recovery_info:
-                        task = (
-                            selected_chunks,
-                            main_pdf_path,
-                            self.show_headings_check.isChecked(),
-                            self.user_heading_entry.text().strip(),
-                            self.model_heading_entry.text().strip(),
-                            recovery_info
-                        )
-                        self.task_queue.put(task)
+                        self.task_queue.put(("file", selected_chunks, recovery_info))
 
                 except Exception as e:
-                    QMessageBox.critical(self, "Error Processing File", f"Could not process {file_name}: {e}")
+                    self._import_skipped.append((file_name, str(e)))
+        finally:
+            self._import_reviewing = False
 
-            self.status_label.setText("Status: All files have been queued for processing.")
-            self.add_button.setEnabled(True)
+        if self._import_scan_done and self.folder_scan_worker is not None:
+            self._finish_folder_import()
 
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to read folder: {e}")
-            self.status_label.setText("Status: Error.")
-            self.add_button.setEnabled(True)
+    def _finish_folder_import(self):
+        """Ends the folder import's file stream so the worker can write the PDF.
+
+        Files that could not be imported are reported together in one message.
+        """
+        self.task_queue.put(("end",))
+        self.folder_scan_worker = None
+        self._show_status("Status: All files have been queued for processing.")
+        self.add_button.setEnabled(True)
+        self._update_batch_button_state()
+
+        if self._import_skipped:
+            parts = [f"{len(self._import_skipped)} file(s) could not be imported:", ""]
+            parts.extend(f"- {name}: {reason}" for name, reason in self._import_skipped)
+            QMessageBox.warning(self, "Skipped Files", "\n".join(parts))
 
 
     def process_selected_chunks(self, chunks, recovery_info=None):
-        """Adds a single PDF generation task to the worker queue.
+        """Adds a single PDF generation task to the worker process's queue.
 
         Args:
             chunks (list[dict]): A list of conversation chunks to be added to the PDF.
             recovery_info (dict, optional): A dictionary of recovery metadata.
                 Defaults to None.
         """
+        # Drop chunks with nothing left to show, so no work is queued for them.
+        chunks = [c for c in chunks if chunk_has_content(c)]
         if not chunks and not recovery_info:
             return
 
@@ -881,17 +1252,17 @@ class MainWindow(QMainWindow):
             return
 
         self.add_button.setEnabled(False)
-        self.status_label.setText("Status: Queuing task...")
+        self._show_status("Status: Queuing task...")
 
-        task = (
-            chunks,
+        self.task_queue.put((
+            "begin",
             main_pdf_path,
             self.show_headings_check.isChecked(),
             self.user_heading_entry.text().strip(),
-            self.model_heading_entry.text().strip(),
-            recovery_info
-        )
-        self.task_queue.put(task)
+            self.model_heading_entry.text().strip()
+        ))
+        self.task_queue.put(("file", chunks, recovery_info))
+        self.task_queue.put(("end",))
 
 
     def process_and_add_pdf(self):
@@ -920,10 +1291,34 @@ class MainWindow(QMainWindow):
     def update_status(self, message):
         """Updates the status label with a message from the worker thread.
 
+        The first message is shown at once; messages arriving within the next
+        100 ms are coalesced, and only the last of them is shown.
+
         Args:
             message (str): The status message to display.
         """
-        self.status_label.setText(f"Status: {message}")
+        self._pending_status = f"Status: {message}"
+        if not self._status_timer.isActive():
+            self._flush_status()
+
+    def _flush_status(self):
+        """Shows the latest coalesced worker message, if any."""
+        if self._pending_status is None:
+            return
+        if self._pending_status != self.status_label.text():
+            self.status_label.setText(self._pending_status)
+        self._pending_status = None
+        self._status_timer.start()
+
+    def _show_status(self, text):
+        """Shows a status right away, dropping any worker message not yet shown.
+
+        Args:
+            text (str): The full status text.
+        """
+        self._status_timer.stop()
+        self._pending_status = None
+        self.status_label.setText(text)
 
     def on_processing_finished(self, message):
         """Handles the 'finished' signal from the worker thread.
@@ -936,25 +1331,35 @@ class MainWindow(QMainWindow):
         """
         if "Error" in message:
             QMessageBox.critical(self, "Error", message)
-            self.status_label.setText("Status: Error!")
+            self._show_status("Status: Error!")
         else:
             # Check if queue is empty to show final message
             if self.task_queue.empty():
-                self.status_label.setText(f"Status: {message}")
+                self._show_status(f"Status: {message}")
             self.user_text_box.clear()
             self.model_text_box.clear()
 
-        self.add_button.setEnabled(True)
+        # A running folder import keeps the button disabled until it ends,
+        # so no other task can start in the middle of its file stream.
+        self.add_button.setEnabled(self.folder_scan_worker is None)
 
     def closeEvent(self, event):
-        """Ensures the worker thread is stopped gracefully when the window is closed.
+        """Ensures the worker process is stopped gracefully when the window is closed.
+
+        The task in progress is finished; tasks that have not started yet are
+        dropped.
 
         Args:
             event (QCloseEvent): The close event.
         """
-        self.worker.stop()
+        if self.folder_scan_worker is not None:
+            self.folder_scan_worker.stop()
+            self.task_queue.put(("end",))  # Let the worker finish the import
+        self.stop_event.set()
         self.task_queue.put(None)  # Sentinel to unblock the worker's get()
-        self.thread.join()
+        self.pdf_process.join()
+        self.event_queue.put(None)  # Unblocks the relay even if the process died
+        self.thread_pool.waitForDone()
         event.accept()
 
 
@@ -1,32 +1,35 @@
 import json
 from abc import ABC, abstractmethod
+from operator import itemgetter
+from json_io import load_json_bytes
+
+# How far into a Gemini file the start of its JSON is looked for.
+JSON_START_WINDOW = 64 * 1024
 
 class ConversationParser(ABC):
     """Abstract base class for conversation parsers."""
     @abstractmethod
     def parse(self, file_path):
-        """Parses a conversation file and returns a list of conversation chunks."""
+        """Parses a conversation file and yields its conversation chunks in order."""
         pass
 
 class GeminiParser(ConversationParser):
     """Parses Gemini conversation files."""
     def parse(self, file_path):
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = f.read()
-
-            json_start_index = data.find('{')
-            if json_start_index == -1:
-                raise ValueError("No JSON content found in the file.")
-
-            json_data_str = data[json_start_index:]
-            json_data = json.loads(json_data_str)
+            with open(file_path, "rb") as f:
+                # The JSON starts after a short preamble, if any; checking the
+                # head first rejects other kinds of files without reading them.
+                json_start_index = f.read(JSON_START_WINDOW).find(b'{')
+                if json_start_index == -1:
+                    raise ValueError("No JSON content found in the file.")
+                f.seek(json_start_index)
+                json_data = load_json_bytes(f.read())
 
             chunks = json_data.get("chunkedPrompt", {}).get("chunks", [])
             if not chunks:
                 raise ValueError("This does not appear to be a valid Gemini file.")
 
-            conversation_parts = []
             user_prompt = None
 
             for chunk in chunks:
@@ -48,10 +51,9 @@ class GeminiParser(ConversationParser):
                         part["model_text"] = chunk.get("text", "").strip()
                     if "inlineImage" in chunk:
                         part["model_image"] = chunk["inlineImage"]
-                    conversation_parts.append(part)
+                    yield part
                     if user_prompt is not None:
                         user_prompt = None
-            return conversation_parts
         except (json.JSONDecodeError, KeyError, ValueError) as e:
             raise ValueError(f"Invalid Gemini JSON format: {e}")
 
@@ -60,8 +62,8 @@ class QwenParser(ConversationParser):
     """Parses Qwen conversation files."""
     def parse(self, file_path):
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                json_data = json.load(f)
+            with open(file_path, "rb") as f:
+                json_data = load_json_bytes(f.read())
 
             # The top level is a list, so we take the first element.
             if not isinstance(json_data, list) or not json_data:
@@ -72,10 +74,15 @@ class QwenParser(ConversationParser):
                 raise ValueError("This does not appear to be a valid Qwen file.")
 
 
-            # Sort messages by timestamp to ensure chronological order
-            sorted_messages = sorted(messages_dict.values(), key=lambda msg: msg.get("timestamp", 0))
+            # Sort messages by timestamp to ensure chronological order. Exports
+            # are usually already in order, which the stable sort handles in a
+            # single pass; messages without a timestamp sort as 0.
+            sorted_messages = list(messages_dict.values())
+            try:
+                sorted_messages.sort(key=itemgetter("timestamp"))
+            except KeyError:
+                sorted_messages.sort(key=lambda msg: msg.get("timestamp", 0))
 
-            conversation_parts = []
             user_prompt = None
 
             for message in sorted_messages:
@@ -95,35 +102,38 @@ class QwenParser(ConversationParser):
                         "user_text": current_user_text,
                         "model_text": model_text,
                     }
-                    conversation_parts.append(part)
+                    yield part
 
                     if user_prompt is not None:
                         user_prompt = None
 
-            return conversation_parts
-
         except (json.JSONDecodeError, KeyError, IndexError) as e:
             raise ValueError(f"Invalid Qwen JSON format: {e}")
 
 
+# Parsers keep no state between files, so one instance of each is shared.
+_PARSERS = {
+    "gemini": GeminiParser(),
+    "qwen": QwenParser(),
+    # Add other parsers here
+}
+
 def get_parser(model_name):
     """Factory function to get the correct parser."""
-    if model_name.lower() == "gemini":
-        return GeminiParser()
-    elif model_name.lower() == "qwen":
-        return QwenParser()
-    # Add other parsers here
-    else:
-        # Default to Gemini for backward compatibility with existing platform names
-        return GeminiParser()
+    # Default to Gemini for backward compatibility with existing platform names
+    return _PARSERS.get(model_name.lower(), _PARSERS["gemini"])
 
 def process_conversation_file(file_path, model_name):
     """
     Parses a conversation file using the appropriate parser based on the model name.
+
+    This is a generator: the file is read and decoded when the first chunk is
+    requested, and the chunks are then built one at a time as they are
+    consumed, so callers never need to hold the whole list.
     """
     try:
         parser = get_parser(model_name)
-        return parser.parse(file_path)
+        yield from parser.parse(file_path)
     except FileNotFoundError:
         print(f"Error: The file '{file_path}' was not found.")
         raise
@@ -1,31 +1,22 @@
 const puppeteer = require('puppeteer');
 const path = require('path');
+const os = require('os');
 const fs = require('fs');
+const readline = require('readline');
 
 /**
- * Generates a PDF from a temporary HTML file using Puppeteer.
- *
- * This script is called by the Python `pdf_engine.py`. It launches a headless
- * Chrome browser, reads the content from `_temp.html`, renders it, and saves
- * it as `_temp_page.pdf`. The Python script is responsible for creating the
- * HTML file and for renaming and moving the final PDF.
+ * Renders an HTML document to PDF in a new page of a running browser.
  *
  * @async
- * @function generatePdf
- * @returns {Promise<void>} A promise that resolves when the PDF is generated.
- * @throws Will exit the process with code 1 if an error occurs.
+ * @function renderPdf
+ * @param {Browser} browser - The Puppeteer browser to render in.
+ * @param {string} htmlContent - The HTML document to render.
+ * @param {string} [pdfPath] - Where to save the PDF, if anywhere.
+ * @returns {Promise<Buffer>} The PDF bytes.
  */
-async function generatePdf() {
+async function renderPdf(browser, htmlContent, pdfPath) {
+    const page = await browser.newPage();
     try {
-        const browser = await puppeteer.launch({
-            headless: "new",
-        });
-        const page = await browser.newPage();
-
-        // The Python script will create this temporary HTML file
-        const htmlFilePath = path.resolve(__dirname, '_temp.html');
-        const htmlContent = fs.readFileSync(htmlFilePath, 'utf8');
-
         // Set the page content and wait for all fonts to load from Google Fonts
         await page.setContent(htmlContent, {
             waitUntil: 'networkidle0'
@@ -39,14 +30,63 @@ async function generatePdf() {
         });
 
         // Generate the PDF
-        await page.pdf({
-            path: '_temp_page.pdf', // The Python script will look for this file
+        return await page.pdf({
+            path: pdfPath,
             format: 'A4',
             printBackground: true,
         });
+    } finally {
+        await page.close();
+    }
+}
+
+/**
+ * Writes to stdout and resolves once the data has been handed off.
+ *
+ * @param {string|Buffer} data - The data to write.
+ * @returns {Promise<void>}
+ */
+function writeStdout(data) {
+    return new Promise((resolve) => process.stdout.write(data, resolve));
+}
+
+/**
+ * Generates a PDF from an HTML document using Puppeteer.
+ *
+ * This script is called as `node generate_pdf.js <html_path> <pdf_path>`.
+ * It launches a headless Chrome browser, reads the content from the HTML
+ * file, renders it, and saves it to the PDF path. An HTML path of `-` reads
+ * the HTML from stdin, and a PDF path of `-` writes the PDF bytes to stdout.
+ * Both default to `-`; status messages always go to stderr.
+ *
+ * @async
+ * @function generatePdf
+ * @returns {Promise<void>} A promise that resolves when the PDF is generated.
+ * @throws Will exit the process with code 1 if an error occurs.
+ */
+async function generatePdf() {
+    try {
+        const browser = await puppeteer.launch({
+            headless: "new",
+        });
+
+        // The HTML is piped in, or read from the named file
+        const htmlSource = process.argv[2] || '-';
+        const pdfTarget = process.argv[3] || '-';
+        const toStdout = pdfTarget === '-';
+        const htmlContent = htmlSource === '-'
+            ? fs.readFileSync(0, 'utf8')
+            : fs.readFileSync(path.resolve(__dirname, htmlSource), 'utf8');
+
+        const pdfBuffer = await renderPdf(
+            browser, htmlContent, toStdout ? undefined : path.resolve(__dirname, pdfTarget)
+        );
 
         await browser.close();
-        console.log('PDF page generated successfully by Puppeteer.');
+        if (toStdout) {
+            await writeStdout(pdfBuffer);
+        }
+        console.error('PDF page generated successfully by Puppeteer.');
 
     } catch (err) {
         console.error('Error generating PDF with Puppeteer:', err);
@@ -54,4 +94,105 @@ async function generatePdf() {
     }
 }
 
-generatePdf();
\ No newline at end of file
+/**
+ * Renders PDFs for the Python `pdf_engine.py` from one long-lived browser.
+ *
+ * Started as `node generate_pdf.js --serve [max_pages]`. Each line on stdin
+ * is a JSON request `{"id": ..., "html": ...}`. Each reply on stdout is a JSON
+ * header line, `{"id": ..., "ok": true, "length": n}` followed by the `n`
+ * bytes of the PDF, or `{"id": ..., "ok": false, "error": message}`.
+ * Up to `max_pages` requests (default: the number of CPUs, at most 4) are
+ * rendered at once, each in its own page of the shared browser, and replies
+ * are sent as pages finish, so they may arrive out of order. The browser is
+ * launched once and closed when stdin is closed and every request is done.
+ * It uses the `.puppeteer-profile` folder next to this script, so its HTTP
+ * cache outlives the process.
+ *
+ * @async
+ * @function serve
+ * @returns {Promise<void>} A promise that resolves when stdin is closed.
+ */
+async function serve() {
+    let browser;
+    try {
+        // A persistent profile keeps Chrome's disk cache between runs, so the
+        // web fonts and scripts every page loads are downloaded only once.
+        browser = await puppeteer.launch({
+            headless: "new",
+            userDataDir: path.join(__dirname, '.puppeteer-profile'),
+        });
+    } catch (profileErr) {
+        // The profile is locked by another running app; use a throwaway one
+        try {
+            browser = await puppeteer.launch({
+                headless: "new",
+            });
+        } catch (err) {
+            console.error('Error launching Puppeteer:', err);
+            process.exit(1);
+        }
+    }
+
+    // A simple counting semaphore bounds the pages open at once
+    const maxPages = parseInt(process.argv[3], 10) || Math.min(4, os.cpus().length);
+    let openPages = 0;
+    const waiting = [];
+    const acquirePage = () => new Promise((resolve) => {
+        if (openPages < maxPages) {
+            openPages++;
+            resolve();
+        } else {
+            waiting.push(resolve);
+        }
+    });
+    const releasePage = () => {
+        const next = waiting.shift();
+        if (next) {
+            next();
+        } else {
+            openPages--;
+        }
+    };
+
+    const handle = async (line) => {
+        let id = null;
+        let pdfBuffer;
+        try {
+            const request = JSON.parse(line);
+            id = request.id;
+            await acquirePage();
+            try {
+                pdfBuffer = await renderPdf(browser, request.html);
+            } finally {
+                releasePage();
+            }
+        } catch (err) {
+            console.error('Error generating PDF with Puppeteer:', err);
+            await writeStdout(JSON.stringify({ id, ok: false, error: String(err) }) + '\n');
+            return;
+        }
+        // Both writes are queued back to back, so replies never interleave
+        process.stdout.write(JSON.stringify({ id, ok: true, length: pdfBuffer.length }) + '\n');
+        await writeStdout(pdfBuffer);
+    };
+
+    const inFlight = new Set();
+    const requests = readline.createInterface({ input: process.stdin, crlfDelay: Infinity });
+    for await (const line of requests) {
+        if (!line.trim()) {
+            continue;
+        }
+        const job = handle(line);
+        inFlight.add(job);
+        job.finally(() => inFlight.delete(job));
+    }
+
+    await Promise.all(inFlight);
+    await browser.close();
+}
+
+if (process.argv[2] === '--serve') {
+    serve();
+} else {
+    generatePdf();
+}
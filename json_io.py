@@ -0,0 +1,34 @@
+import json
+try:
+    import orjson  # Optional: a much faster JSON parser and serializer
+except ImportError:
+    orjson = None
+
+def load_json_bytes(data):
+    """Parses JSON from raw bytes, using orjson when it is installed.
+
+    Args:
+        data (bytes): The UTF-8 encoded JSON document.
+
+    Returns:
+        The parsed JSON value.
+
+    Raises:
+        ValueError: If `data` is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def dump_json_bytes(value):
+    """Serializes a value to indented UTF-8 JSON, using orjson when it is installed.
+
+    Args:
+        value: The JSON-serializable value.
+
+    Returns:
+        bytes: The encoded JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2)
+    return json.dumps(value, indent=2, ensure_ascii=False).encode("utf-8")
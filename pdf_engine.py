@@ -1,6 +1,16 @@
+import io
 import os
+import json
+import threading
+import functools
+import itertools
 import subprocess
+from concurrent.futures import Future
 from pypdf import PdfWriter, PdfReader
+try:
+    import pikepdf  # Optional: merges with qpdf, much faster than pypdf
+except ImportError:
+    pikepdf = None
 import html
 import markdown
 import re
@@ -8,6 +18,57 @@ from pygments import highlight
 from pygments.lexers import get_lexer_by_name, TextLexer
 from pygments.formatters import HtmlFormatter
 
+# Fenced code blocks, with the info string (the language) and the code.
+CODE_BLOCK_PATTERN = re.compile(r"^[ \t]*```([^\n]*)\n(.*?)\n^[ \t]*```", re.DOTALL | re.MULTILINE)
+# The placeholders left for code blocks, alone in a paragraph or inline.
+PLACEHOLDER_PATTERN = re.compile(r"<p>(?:CODE|MERMAID)BLOCK(\d+)</p>|(?:CODE|MERMAID)BLOCK(\d+)")
+# Formatting keeps no per-call state, so every code block shares one formatter.
+CODE_FORMATTER = HtmlFormatter(cssclass="codehilite")
+
+@functools.lru_cache(maxsize=64)
+def get_code_lexer(language):
+    """
+    Returns the Pygments lexer for a code block's language.
+
+    Conversations repeat a handful of languages, so each lexer is looked up
+    once and then shared, like the formatter.
+
+    Args:
+        language (str): The language named after the opening fence.
+
+    Returns:
+        pygments.lexer.Lexer: The matching lexer, or a plain text lexer if
+            the language is unknown.
+    """
+    try:
+        return get_lexer_by_name(language)
+    except Exception:
+        return TextLexer()
+
+# Markdown instances are not thread-safe, so each render thread keeps its own
+_markdown_local = threading.local()
+
+def get_markdown_converter():
+    """
+    Returns this thread's Markdown converter, creating it on first use.
+
+    Building a converter loads every extension, so one instance is reused for
+    all the text a thread renders and reset before each conversion.
+
+    Returns:
+        markdown.Markdown: A converter that is ready to use.
+    """
+    converter = getattr(_markdown_local, "converter", None)
+    if converter is None:
+        converter = markdown.Markdown(
+            extensions=['tables', 'nl2br', 'pymdownx.arithmatex'],
+            extension_configs={
+                'pymdownx.arithmatex': {'generic': True}
+            }
+        )
+        _markdown_local.converter = converter
+    return converter.reset()
+
 def markdown_to_html_final(markdown_text):
     """
     Converts a Markdown string to HTML, with special handling for code blocks.
@@ -34,82 +95,259 @@ def markdown_to_html_final(markdown_text):
 
         placeholder = f"CODEBLOCK{len(highlighted_blocks)}"
 
-        try:
-            lexer = get_lexer_by_name(language)
-        except Exception:
-            lexer = TextLexer()
-
-        formatter = HtmlFormatter(cssclass="codehilite")
-        highlighted_code = highlight(content, lexer, formatter)
+        highlighted_code = highlight(content, get_code_lexer(language), CODE_FORMATTER)
         highlighted_blocks.append(highlighted_code)
 
         # Return a simple placeholder that won't be altered by markdown processing
         return placeholder
 
     # 1. Find all code blocks, highlight them, and replace with a simple placeholder.
-    pattern = re.compile(r"^[ \t]*```([^\n]*)\n(.*?)\n^[ \t]*```", re.DOTALL | re.MULTILINE)
-    text_with_placeholders = pattern.sub(_highlight_and_replace, markdown_text)
+    text_with_placeholders = CODE_BLOCK_PATTERN.sub(_highlight_and_replace, markdown_text)
+
+    # A message that is nothing but one code block needs no Markdown pass;
+    # the placeholder would come back alone in a paragraph and be replaced.
+    if len(highlighted_blocks) == 1 and text_with_placeholders.strip("\n") in ("CODEBLOCK0", "MERMAIDBLOCK0"):
+        return highlighted_blocks[0]
 
     # 2. Process the main text (which now contains only placeholders).
-    html_output = markdown.markdown(
-        text_with_placeholders,
-        extensions=['tables', 'nl2br', 'pymdownx.arithmatex'],
-        extension_configs={
-            'pymdownx.arithmatex': {'generic': True}
-        }
-    )
-
-    # 3. Replace the placeholders with the fully rendered HTML for the code blocks.
-    for i, block_html in enumerate(highlighted_blocks):
-        # Handle both CODEBLOCK and MERMAIDBLOCK
-        # The markdown processor might wrap the placeholder in <p> tags.
-        for prefix in ["CODEBLOCK", "MERMAIDBLOCK"]:
-            placeholder = f"{prefix}{i}"
-            placeholder_p = f"<p>{placeholder}</p>"
-            if placeholder_p in html_output:
-                html_output = html_output.replace(placeholder_p, block_html)
-            else:
-                html_output = html_output.replace(placeholder, block_html)
+    html_output = get_markdown_converter().convert(text_with_placeholders)
+
+    # 3. Replace the placeholders with the fully rendered HTML for the code blocks,
+    # in a single pass. The markdown processor might wrap a placeholder in <p> tags.
+    def _restore_block(match):
+        index = int(match.group(1) or match.group(2))
+        if index < len(highlighted_blocks):
+            return highlighted_blocks[index]
+        return match.group(0)
+
+    if highlighted_blocks:
+        html_output = PLACEHOLDER_PATTERN.sub(_restore_block, html_output)
 
     return html_output
 
-def merge_pdfs(main_pdf_path, new_page_path):
-    """Merges a new PDF page into a main PDF file.
+class PdfAppender:
+    """Appends pages to a main PDF that is read and written only once.
 
-    If the main PDF does not exist, the new page is renamed to become the main
-    PDF. Otherwise, the new page is appended to the existing pages. The new
-    page file is always deleted after the operation.
+    The main PDF, if it exists, is loaded when the appender is created. New
+    pages are appended in memory, and `flush` writes the result back in a
+    single pass through a temporary file. When pikepdf is installed, qpdf
+    does the work; otherwise pypdf's `PdfWriter` is used.
 
-    Args:
-        main_pdf_path (str): The file path for the primary PDF document.
-        new_page_path (str): The file path for the new PDF page to be merged.
+    Attributes:
+        main_pdf_path (str): The file path of the main PDF.
+        writer (pikepdf.Pdf or PdfWriter): The document holding the main PDF
+            and new pages.
+        new_page_count (int): The number of pages appended so far.
+    """
+    def __init__(self, main_pdf_path):
+        """Initializes the PdfAppender and loads the main PDF.
 
-    Returns:
-        bool: True if the merge was successful, False otherwise.
+        Args:
+            main_pdf_path (str): The file path of the main PDF.
+        """
+        self.main_pdf_path = main_pdf_path
+        self.new_page_count = 0
+        # qpdf copies page data from the appended PDFs lazily, so they stay
+        # open until the result has been written.
+        self._sources = []
+        if pikepdf is not None:
+            if os.path.exists(main_pdf_path):
+                self.writer = pikepdf.open(main_pdf_path)
+            else:
+                self.writer = pikepdf.new()
+        # Cloning takes the whole document in one step, instead of copying
+        # its pages one by one into an empty writer.
+        elif os.path.exists(main_pdf_path):
+            self.writer = PdfWriter(clone_from=main_pdf_path)
+        else:
+            self.writer = PdfWriter()
+
+    def append(self, pdf):
+        """Appends every page of a PDF.
+
+        Args:
+            pdf (bytes or str): The contents of a PDF, or the path to one.
+
+        Returns:
+            int: The number of pages appended.
+        """
+        if isinstance(pdf, (bytes, bytearray)):
+            pdf = io.BytesIO(pdf)
+        if pikepdf is not None:
+            source = pikepdf.open(pdf)
+            self._sources.append(source)
+            pages = source.pages
+            self.writer.pages.extend(pages)
+        else:
+            pages = PdfReader(pdf).pages
+            for page in pages:
+                self.writer.add_page(page)
+        self.new_page_count += len(pages)
+        return len(pages)
+
+    def flush(self):
+        """Writes the main PDF back to disk.
+
+        The PDF is written next to the target and swapped in, so a failure
+        never leaves a half-written main PDF behind.
+        """
+        temp_main_path = f"{self.main_pdf_path}.tmp"
+        if pikepdf is not None:
+            self.writer.save(temp_main_path)
+            # Release the main PDF's file handle before replacing the file.
+            self.close()
+        else:
+            with open(temp_main_path, "wb") as f:
+                self.writer.write(f)
+        os.replace(temp_main_path, self.main_pdf_path)
+
+    def close(self):
+        """Releases the open PDFs; the appender cannot be used afterwards."""
+        if pikepdf is not None:
+            for source in self._sources:
+                source.close()
+            self._sources.clear()
+            self.writer.close()
+
+class PuppeteerRenderer:
+    """A long-lived `generate_pdf.js` process that renders HTML to PDF.
+
+    The Node script is started in `--serve` mode on the first render and
+    keeps one headless browser open, so Node, Puppeteer and Chrome start up
+    once instead of once per page. Renders may be requested from several
+    threads at once: each request carries an id, the script renders a few
+    pages of the shared browser concurrently, and a reader thread hands each
+    reply to the thread waiting for it. If the process dies, the renders in
+    flight fail and the next render starts a new one.
+
+    Two locks keep the pipes flowing: one serializes writes to the script's
+    stdin, and one guards the table of waiting renders. The reader thread
+    only ever takes the second, so it keeps draining stdout even while a
+    large request is blocked writing to a full stdin pipe.
+
+    Attributes:
+        process (subprocess.Popen or None): The running Node process.
     """
-    try:
-        if not os.path.exists(main_pdf_path):
-            os.rename(new_page_path, main_pdf_path)
-            return True
-
-        writer = PdfWriter()
-        reader_main = PdfReader(main_pdf_path)
-        for page in reader_main.pages:
-            writer.add_page(page)
-            
-        reader_new = PdfReader(new_page_path)
-        for page in reader_new.pages:
-            writer.add_page(page)
-            
-        with open(main_pdf_path, "wb") as f:
-            writer.write(f)
-        return True
-    except Exception as e:
-        print(f"Error merging PDFs: {e}")
-        return False
-    finally:
-        if os.path.exists(new_page_path):
-            os.remove(new_page_path)
+    def __init__(self):
+        """Initializes the PuppeteerRenderer without starting Node yet."""
+        self.process = None
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._pending = {}
+        self._reader = None
+
+    def render(self, html_content):
+        """Renders an HTML document to PDF, waiting for the result.
+
+        Args:
+            html_content (str): The HTML document.
+
+        Returns:
+            bytes: The PDF.
+
+        Raises:
+            RuntimeError: If the page could not be rendered.
+            FileNotFoundError: If Node.js is not installed.
+        """
+        future = Future()
+        # Pages embed their images as base64, so the request can be large;
+        # it is serialized before taking the lock that guards the pipe.
+        request_id = next(self._ids)
+        request = json.dumps({"id": request_id, "html": html_content}).encode('utf-8') + b"\n"
+        with self._write_lock:
+            with self._lock:
+                if self.process is None or self.process.poll() is not None:
+                    self._start()
+                process, pending = self.process, self._pending
+                pending[request_id] = future
+            # The write may block until Node reads; only the write lock is held.
+            try:
+                process.stdin.write(request)
+                process.stdin.flush()
+            except OSError as e:
+                with self._lock:
+                    pending.pop(request_id, None)
+                raise RuntimeError(f"The Puppeteer process stopped unexpectedly: {e}")
+        return future.result()
+
+    def close(self):
+        """Closes the browser once its renders finish, and waits for Node to exit."""
+        with self._write_lock, self._lock:
+            process, reader = self.process, self._reader
+            self.process = self._reader = None
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+            process.wait(timeout=30)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+            process.wait()
+        reader.join()
+
+    def _start(self):
+        """Starts the Node process and the thread reading its replies."""
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        self.process = subprocess.Popen(
+            ['node', os.path.join(script_dir, 'generate_pdf.js'), '--serve'],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, cwd=script_dir
+        )
+        # Each process gets its own table of waiting renders, so a dying
+        # process only fails the renders that were sent to it.
+        self._pending = {}
+        self._reader = threading.Thread(
+            target=self._read_replies, args=(self.process, self._pending),
+            name="puppeteer-reader", daemon=True
+        )
+        self._reader.start()
+
+    def _read_replies(self, process, pending):
+        """Delivers each reply of a Node process to its waiting render."""
+        error = "it exited without replying"
+        try:
+            for reply_line in iter(process.stdout.readline, b""):
+                reply = json.loads(reply_line)
+                if reply.get("ok"):
+                    pdf_bytes = process.stdout.read(reply["length"])
+                    if len(pdf_bytes) != reply["length"]:
+                        error = "it stopped in the middle of a page"
+                        break
+                    result = pdf_bytes
+                else:
+                    result = RuntimeError(f"Puppeteer could not render the page: {reply.get('error')}")
+                with self._lock:
+                    future = pending.pop(reply["id"], None)
+                if future is None:
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+        except (OSError, ValueError, KeyError) as e:
+            error = str(e)
+        finally:
+            process.stdout.close()
+            with self._lock:
+                orphans = list(pending.values())
+                pending.clear()
+            for future in orphans:
+                future.set_exception(RuntimeError(f"The Puppeteer process stopped unexpectedly: {error}"))
+
+# One renderer is shared by every rendering thread of the process.
+_renderer = PuppeteerRenderer()
+
+def get_renderer():
+    """Returns the process-wide `PuppeteerRenderer`."""
+    return _renderer
+
+def close_renderer():
+    """Ends the shared renderer's Node process once its renders finish.
+
+    The next render starts a new one, so this is safe to call whenever a
+    batch is done.
+    """
+    _renderer.close()
 
 def format_recovery_info(recovery_info):
     """Formats the recovery information dictionary into a styled HTML table.
@@ -125,8 +363,8 @@ def format_recovery_info(recovery_info):
     if not recovery_info:
         return ""
 
-    # Start building the HTML content
-    html_block = "<div class='recovery-info'><h2>Recovery Information</h2><table>"
+    # Start building the HTML content; the parts are joined once at the end
+    html_parts = ["<div class='recovery-info'><h2>Recovery Information</h2><table>"]
 
     # Define the desired order and display names for keys
     key_map = {
@@ -145,22 +383,74 @@ def format_recovery_info(recovery_info):
         if value:  # Only add a row if the value exists
             # Escape the value to prevent HTML injection issues
             escaped_value = html.escape(str(value))
-            html_block += f"<tr><td class='key'>{display_name}:</td><td class='value'>{escaped_value}</td></tr>"
+            html_parts.append(f"<tr><td class='key'>{display_name}:</td><td class='value'>{escaped_value}</td></tr>")
 
-    html_block += "</table></div>"
-    return html_block
+    html_parts.append("</table></div>")
+    return "".join(html_parts)
+
+@functools.lru_cache(maxsize=None)
+def page_shell(include_math=True, include_diagrams=True):
+    """Returns the HTML around the body of every page, with the CSS embedded.
+
+    Each variant is built on its first use only; later pages reuse the
+    result.
+
+    Args:
+        include_math (bool): Whether to load MathJax to typeset math.
+        include_diagrams (bool): Whether to load Mermaid to draw diagrams.
+
+    Returns:
+        tuple[str, str]: The document up to and including `<body>`, and the
+        closing tags after the body's content.
+    """
+    css_path = os.path.join(os.path.dirname(__file__), 'style.css')
+    with open(css_path, 'r', encoding='utf-8') as f:
+        css_content = f.read()
+
+    # The math and diagram libraries are large downloads that take time to
+    # start up, so pages that do not use them leave them out.
+    math_script = """
+            <script id="MathJax-script" async src="https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-chtml.js"></script>""" if include_math else ""
+    diagram_script = """
+            <script src="https://cdn.jsdelivr.net/npm/mermaid/dist/mermaid.min.js"></script>
+            <script>
+                mermaid.initialize({ startOnLoad: true });
+            </script>""" if include_diagrams else ""
+
+    # The embedded CSS is the key to making the fonts and emojis work perfectly.
+    page_head = f"""
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <meta charset="UTF-8">
+            <title>PDF Page</title>
+            <link rel="preconnect" href="https://fonts.googleapis.com">
+            <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+            <link href="https://fonts.googleapis.com/css2?family=Noto+Color+Emoji&family=Roboto:wght@400;700&display=swap" rel="stylesheet">{math_script}{diagram_script}
+            <style>
+                {css_content}
+            </style>
+        </head>
+        <body>"""
+    page_tail = """        </body>
+        </html>
+        """
+    return page_head, page_tail
 
 def create_pdf_page(user_text, model_text, output_path, model_images=None, show_headings=True, user_heading="User Message", model_heading="Model Response", user_response_num=None, model_response_num=None, recovery_info=None):
     """Creates a single, styled PDF page from text and optional image data.
 
-    This function generates a temporary HTML file with embedded CSS, populates it
-    with the provided conversation data and recovery information, and then calls
-    a Node.js script which uses Puppeteer to render the HTML into a PDF file.
+    This function builds an HTML document with embedded CSS, populates it
+    with the provided conversation data and recovery information, and then sends
+    it to the shared `PuppeteerRenderer`, a long-lived Node.js process
+    which uses Puppeteer to render the HTML into a PDF file.
 
     Args:
         user_text (str): The text of the user's message.
         model_text (str): The text of the model's response.
-        output_path (str): The file path where the generated PDF page will be saved.
+        output_path (str or file-like): The file path where the generated PDF
+            page will be saved, or a writable binary stream (e.g. `io.BytesIO`)
+            that receives the PDF bytes.
         model_images (list[dict], optional): A list of dictionaries containing 'mimeType' and base64
             'data' for images. Defaults to None.
         show_headings (bool, optional): Whether to include headings for user/model
@@ -179,39 +469,38 @@ def create_pdf_page(user_text, model_text, output_path, model_images=None, show_
     Returns:
         bool: True if the PDF page was created successfully, False otherwise.
     """
-    temp_html_path = os.path.join(os.path.dirname(__file__), '_temp.html')
-
     try:
-        # --- 1. Read CSS Content ---
-        css_path = os.path.join(os.path.dirname(__file__), 'style.css')
-        with open(css_path, 'r', encoding='utf-8') as f:
-            css_content = f.read()
-
-        # --- 2. Prepare HTML Content ---
+        # --- 1. Prepare HTML Content ---
+        # Sections are collected as lists of parts and joined once, so large
+        # responses and image data are copied a single time.
         recovery_section = format_recovery_info(recovery_info)
+        # The converted Markdown, checked below for math and diagrams
+        text_html = []
 
-        user_section = ""
+        user_section = []
         if user_text:
             if show_headings and user_heading:
                 heading_html = f"<span>{html.escape(user_heading)}</span>"
                 # if user_response_num is not None:
                 #     heading_html += f"<span class='response-number'>{user_response_num}</span>"
-                user_section += f"<div class='heading-container'><h1>{heading_html}</h1></div>"
+                user_section.append(f"<div class='heading-container'><h1>{heading_html}</h1></div>")
             user_text_html = markdown_to_html_final(user_text)
-            user_section += f"<div class='content'>{user_text_html}</div>"
+            text_html.append(user_text_html)
+            user_section.extend(("<div class='content'>", user_text_html, "</div>"))
 
-        model_section = ""
+        model_section = []
         if model_text or model_images:
             if show_headings and model_heading:
                 if model_text or (model_images and not model_text):
                     heading_html = f"<span>{html.escape(model_heading)}</span>"
                     # if model_response_num is not None:
                     #     heading_html += f"<span class='response-number'>{model_response_num}</span>"
-                    model_section += f"<div class='heading-container'><h1>{heading_html}</h1></div>"
+                    model_section.append(f"<div class='heading-container'><h1>{heading_html}</h1></div>")
 
             if model_text:
                 model_text_html = markdown_to_html_final(model_text)
-                model_section += f"<div class='content'>{model_text_html}</div>"
+                text_html.append(model_text_html)
+                model_section.extend(("<div class='content'>", model_text_html, "</div>"))
 
             if model_images:
                 for img in model_images:
@@ -224,67 +513,48 @@ def create_pdf_page(user_text, model_text, output_path, model_images=None, show_
                         
                         # Add description if present
                         if description:
-                            model_section += f'<p class="image-description">{html.escape(description)}</p>'
+                            model_section.append(f'<p class="image-description">{html.escape(description)}</p>')
                         
                         # The 'data' from the file is already base64, so we create a data URI
-                        image_uri = f"data:{mime_type};base64,{data}"
-                        model_section += f'<img src="{image_uri}" alt="Generated Image" style="max-width: 100%; height: auto; margin-bottom: 20px;">'
+                        model_section.extend((
+                            f'<img src="data:{mime_type};base64,', data,
+                            '" alt="Generated Image" style="max-width: 100%; height: auto; margin-bottom: 20px;">'
+                        ))
                     except Exception as e:
                         print(f"Warning: Could not process image. Error: {e}")
-                        model_section += "<p><i>[Image could not be processed]</i></p>"
-
-        # --- 3. Create the temporary HTML file with Embedded CSS ---
-        # This is the key to making the fonts and emojis work perfectly.
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            <title>PDF Page</title>
-            <link rel="preconnect" href="https://fonts.googleapis.com">
-            <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-            <link href="https://fonts.googleapis.com/css2?family=Noto+Color+Emoji&family=Roboto:wght@400;700&display=swap" rel="stylesheet">
-            <script id="MathJax-script" async src="https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-chtml.js"></script>
-            <script src="https://cdn.jsdelivr.net/npm/mermaid/dist/mermaid.min.js"></script>
-            <script>
-                mermaid.initialize({{ startOnLoad: true }});
-            </script>
-            <style>
-                {css_content}
-            </style>
-        </head>
-        <body>
-            {recovery_section}
-            {user_section}
-            {model_section}
-        </body>
-        </html>
-        """
-        with open(temp_html_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
-
-        # --- 3. Call the Puppeteer script ---
-        # We run the Node.js script as a separate process.
-        script_path = os.path.join(os.path.dirname(__file__), 'generate_pdf.js')
-        subprocess.run(
-            ['node', script_path],
-            check=True,  # This will raise an error if the script fails
-            cwd=os.path.dirname(__file__) # Ensure it runs in the correct directory
+                        model_section.append("<p><i>[Image could not be processed]</i></p>")
+
+        # --- 2. Get the page shell, with only the scripts this page needs ---
+        # Arithmatex marks every formula it finds; MathJax also typesets bare
+        # LaTeX environments.
+        page_head, page_tail = page_shell(
+            include_math=any('class="arithmatex"' in part or "\\begin{" in part for part in text_html),
+            include_diagrams=any('<pre class="mermaid">' in part for part in text_html)
         )
 
-        # The JS script creates '_temp_page.pdf', which we rename to the final output path
-        os.rename(os.path.join(os.path.dirname(__file__), '_temp_page.pdf'), output_path)
-
-        print(f"Successfully created PDF page at: {output_path}")
+        # --- 3. Build the HTML document with Embedded CSS ---
+        html_content = "".join((
+            page_head, "\n            ", recovery_section,
+            "\n            ", *user_section,
+            "\n            ", *model_section,
+            "\n", page_tail
+        ))
+
+        # --- 4. Render with the Puppeteer process ---
+        # The Node.js process and its browser stay up between pages; the
+        # HTML goes in through its stdin and the PDF comes back on stdout.
+        pdf_bytes = get_renderer().render(html_content)
+        if hasattr(output_path, "write"):
+            output_path.write(pdf_bytes)
+        else:
+            with open(output_path, "wb") as f:
+                f.write(pdf_bytes)
+            print(f"Successfully created PDF page at: {output_path}")
         return True
 
-    except (subprocess.CalledProcessError, FileNotFoundError) as e:
+    except (RuntimeError, FileNotFoundError) as e:
         print(f"Error calling Puppeteer script: {e}")
         return False
     except Exception as e:
         print(f"An error occurred: {e}")
         return False
-    finally:
-        # --- 4. Clean up the temporary HTML file ---
-        if os.path.exists(temp_html_path):
-            os.remove(temp_html_path)
@@ -0,0 +1,424 @@
+import os
+import io
+import time
+import bisect
+import difflib
+import functools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from json_io import load_json_bytes
+
+try:
+    from pybase64 import b64encode
+except ImportError:  # Optional; SIMD-accelerated, same output as base64
+    from base64 import b64encode
+
+try:
+    from rapidfuzz import fuzz, process as fuzz_process
+except ImportError:  # Optional; matching falls back to difflib alone
+    fuzz_process = None
+
+# --- Page rendering ---
+# The render threads share one headless browser, which renders up to four
+# pages at once; more threads would only queue there.
+# The browser runs in its own Node process and does the heavy lifting; the
+# Python side only builds the HTML, so a thread pool already keeps every core
+# busy without the start-up and pickling cost of a process pool.
+MAX_RENDER_WORKERS = min(4, os.cpu_count() or 1)
+# Pages submitted but not yet appended; bounds the memory of a long import.
+MAX_PAGES_IN_FLIGHT = 2 * MAX_RENDER_WORKERS
+# Supplemental images are read in parallel; the reads mostly wait on storage.
+MAX_IMAGE_READERS = 8
+# Minimum seconds between "Rendering page" updates sent to the GUI.
+PROGRESS_INTERVAL = 0.1
+
+def render_page_bytes(page_kwargs):
+    """Renders a single PDF page in memory.
+
+    Args:
+        page_kwargs (dict): Keyword arguments for `create_pdf_page`, without
+            `output_path`.
+
+    Returns:
+        bytes or None: The rendered PDF, or None if rendering failed.
+    """
+    from pdf_engine import create_pdf_page
+
+    page_buffer = io.BytesIO()
+    if not create_pdf_page(output_path=page_buffer, **page_kwargs):
+        return None
+    return page_buffer.getvalue()
+
+def load_latest_mapping(mappings_dir="mappings"):
+    """Loads the newest supplemental image mapping, if there is one.
+
+    Args:
+        mappings_dir (str, optional): The folder holding the `mapping_*.json`
+            files. Defaults to "mappings".
+
+    Returns:
+        list[dict]: The mapping entries, or an empty list.
+    """
+    latest_mapping = []
+    if os.path.exists(mappings_dir):
+        # The names carry a sortable timestamp, so the newest is the largest;
+        # a single pass finds it without sorting the whole folder.
+        with os.scandir(mappings_dir) as it:
+            latest_mapping_file = max(
+                (e.name for e in it if e.name.startswith("mapping_") and e.name.endswith(".json")),
+                default=None
+            )
+        if latest_mapping_file:
+            try:
+                with open(os.path.join(mappings_dir, latest_mapping_file), 'rb') as f:
+                    latest_mapping = load_json_bytes(f.read())
+            except Exception as e:
+                print(f"Error loading mapping: {e}")
+    return latest_mapping
+
+@functools.lru_cache(maxsize=64)
+def encode_image_file(path, mtime_ns, size):
+    """Reads an image file and returns its contents as base64 text.
+
+    Results are cached by path, modification time and size, so an image
+    matched by several responses is read and encoded only once, and an
+    image that changes on disk is read again. `run_task` clears the cache
+    when its task ends.
+
+    Args:
+        path (str): The path of the image file.
+        mtime_ns (int): The file's modification time, in nanoseconds.
+        size (int): The file's size, in bytes.
+
+    Returns:
+        str: The base64-encoded file contents.
+    """
+    with open(path, "rb") as f:
+        return b64encode(f.read()).decode('ascii')
+
+class SnippetIndex:
+    """Matches model responses against the text snippets of an image mapping.
+
+    A snippet matches when its `difflib` ratio against the response is above
+    0.9. The index is built once per task. Each snippet keeps its own
+    `SequenceMatcher`, which indexes its second sequence once, and the
+    snippets are sorted by length: a ratio above 0.9 needs a snippet
+    between 9/11 and 11/9 of the response's length, so a bisect narrows
+    every lookup to that window before any text is compared.
+
+    Attributes:
+        matchers (list[tuple]): `(item, matcher)` pairs for the mapping
+            entries with a snippet, in mapping order.
+    """
+    def __init__(self, latest_mapping):
+        """Initializes the SnippetIndex.
+
+        Args:
+            latest_mapping (list[dict]): The latest supplemental image mapping.
+        """
+        self.matchers = [
+            (item, difflib.SequenceMatcher(None, "", item["text_snippet"]))
+            for item in latest_mapping if item.get("text_snippet")
+        ]
+        self._by_length = sorted(range(len(self.matchers)), key=lambda i: len(self.matchers[i][0]["text_snippet"]))
+        self._lengths = [len(self.matchers[i][0]["text_snippet"]) for i in self._by_length]
+
+    def __bool__(self):
+        """Returns whether the mapping has any snippet to match."""
+        return bool(self.matchers)
+
+    def matches(self, model_text):
+        """Finds the mapping entries whose snippet matches a model response.
+
+        Snippets in the length window are ruled out by cheaper upper bounds
+        of the ratio first: rapidfuzz's `fuzz.ratio` if it is installed (the
+        LCS it is built on is never shorter than difflib's matching blocks),
+        otherwise the matchers' quick ratios.
+
+        Args:
+            model_text (str): The text of the model response.
+
+        Yields:
+            dict: The matching mapping entries, in mapping order.
+        """
+        text_length = len(model_text)
+        low = bisect.bisect_left(self._lengths, text_length * 9 / 11)
+        high = bisect.bisect_right(self._lengths, text_length * 11 / 9)
+        shortlist = [self.matchers[i] for i in sorted(self._by_length[low:high])]
+        if not shortlist:
+            return
+
+        if fuzz_process is not None:
+            candidates = fuzz_process.extract(
+                model_text, [item["text_snippet"] for item, _ in shortlist],
+                scorer=fuzz.ratio, processor=None, score_cutoff=90, limit=None
+            )
+            shortlist = [shortlist[index] for index in sorted(index for _, _, index in candidates)]
+
+        for item, matcher in shortlist:
+            matcher.set_seq1(model_text)
+            if fuzz_process is None and (matcher.real_quick_ratio() <= 0.9 or matcher.quick_ratio() <= 0.9):
+                continue
+            if matcher.ratio() > 0.9: # High confidence match
+                yield item
+
+def read_supplemental_image(path):
+    """Reads one supplemental image through the `encode_image_file` cache.
+
+    Args:
+        path (str): The path of the image file.
+
+    Returns:
+        str or None: The base64-encoded image, or None if it is missing or
+        cannot be read.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None  # Missing images are skipped
+    try:
+        return encode_image_file(path, stat.st_mtime_ns, stat.st_size)
+    except Exception as e:
+        print(f"Error reading supplemental image: {e}")
+        return None
+
+def collect_page_jobs(chunks, recovery_info, snippet_index, page_options):
+    """Builds the rendering jobs for one file's recovery page and chunks.
+
+    Resolves which parts of each chunk are included and attaches the
+    chunk's own image plus any supplemental images matched from the
+    latest mapping. The supplemental images of the whole file are read
+    concurrently, so slow storage costs about one read instead of one per
+    image. Chunks with nothing left to show are skipped.
+
+    Args:
+        chunks (list[dict]): The selected chunks of the file, each with
+            `user_text`, `model_text`, `include_user` and `include_model`.
+        recovery_info (dict or None): Recovery metadata for the file.
+        snippet_index (SnippetIndex): The index of the latest mapping.
+        page_options (dict): The `show_headings`, `user_heading` and
+            `model_heading` arguments shared by every chunk page.
+
+    Returns:
+        list[dict]: Keyword arguments for `create_pdf_page`, in page order.
+    """
+    page_jobs = []
+    if recovery_info:
+        page_jobs.append({
+            "user_text": "", "model_text": "",
+            "recovery_info": recovery_info
+        })
+
+    # --- Process Chunks ---
+    pages = []
+    for chunk in chunks:
+        # Selected chunks always carry these four keys, so index directly.
+        include_model = chunk["include_model"]
+        user_text = chunk["user_text"] if chunk["include_user"] else ""
+        model_text = chunk["model_text"] if include_model else ""
+
+        # Handle multiple images (existing + supplemental)
+        model_images = []
+        supplemental_images = []
+        if include_model:
+            # Add existing image from export if any
+            existing_img = chunk.get("model_image")
+            if existing_img:
+                model_images.append(existing_img)
+
+            # Add supplemental images via fuzzy matching
+            if model_text and snippet_index:
+                for item in snippet_index.matches(model_text):
+                    img_objs = item.get("images", [])
+                    # Fallback for old formats
+                    if not img_objs:
+                        img_paths = item.get("image_paths", [])
+                        if not img_paths and item.get("image_path"):
+                            img_paths = [item.get("image_path")]
+                        img_objs = [{"path": p, "desc": ""} for p in img_paths]
+
+                    for img_obj in img_objs:
+                        img_path = img_obj.get("path")
+                        if img_path:
+                            supplemental_images.append((img_path, img_obj.get("desc", "")))
+
+        pages.append((chunk, user_text, model_text, model_images, supplemental_images))
+
+    # --- Read the supplemental images ---
+    image_paths = list(dict.fromkeys(
+        img_path for *_, supplemental_images in pages for img_path, _ in supplemental_images
+    ))
+    image_data = {}
+    if image_paths:
+        with ThreadPoolExecutor(max_workers=min(MAX_IMAGE_READERS, len(image_paths))) as pool:
+            image_data = dict(zip(image_paths, pool.map(read_supplemental_image, image_paths)))
+
+    for chunk, user_text, model_text, model_images, supplemental_images in pages:
+        for img_path, img_desc in supplemental_images:
+            data = image_data[img_path]
+            if data is not None:
+                model_images.append({
+                    "mimeType": "image/png",
+                    "data": data,
+                    "description": img_desc
+                })
+
+        user_response_num = chunk.get("user_response_num")
+        model_response_num = chunk.get("model_response_num")
+
+        if not user_text and not model_text and not model_images:
+            continue
+
+        page_jobs.append({
+            "user_text": user_text, "model_text": model_text,
+            "model_images": model_images,
+            "user_response_num": user_response_num,
+            "model_response_num": model_response_num, "recovery_info": None,
+            **page_options
+        })
+
+    return page_jobs
+
+def run_task(main_pdf_path, show_headings, user_heading, model_heading, files, emit_progress):
+    """Renders the pages of one task and merges them into the main PDF.
+
+    Args:
+        main_pdf_path (str): The file path of the main PDF.
+        show_headings (bool): Whether to include headings.
+        user_heading (str): The heading for user messages.
+        model_heading (str): The heading for model responses.
+        files (iterable): The task's files as `(chunks, recovery_info)` pairs;
+            may be a stream that yields files as they are reviewed.
+        emit_progress (callable): Called with a status message as work progresses.
+    """
+    # The PDF engine pulls in pypdf, markdown and pygments; it is only
+    # needed once there is work to do.
+    from pdf_engine import PdfAppender, close_renderer
+
+    snippet_index = SnippetIndex(load_latest_mapping())
+
+    # Bound once per task; these are used inside the page loops.
+    main_pdf_name = os.path.basename(main_pdf_path)
+    page_options = {
+        "show_headings": show_headings,
+        "user_heading": user_heading,
+        "model_heading": model_heading
+    }
+
+    # The main PDF is loaded once per task and every new page is
+    # appended to the same writer. The result is written back to
+    # disk only once, at the end.
+    appender = PdfAppender(main_pdf_path)
+
+    # --- Render pages concurrently, append them in order ---
+    # Rendering happens in a shared Node process, so threads are
+    # enough to keep several renders in flight. Each
+    # file's pages are submitted as soon as the file arrives, so
+    # a folder import renders while the user is still reviewing.
+    # Finished pages are appended as they come in, and at most
+    # MAX_PAGES_IN_FLIGHT are pending at once, so page data and
+    # rendered bytes never pile up for a long import.
+    try:
+        with ThreadPoolExecutor(max_workers=MAX_RENDER_WORKERS, thread_name_prefix="pdf-render") as pool:
+            pending = deque()
+            submitted = 0
+            appended = 0
+            last_progress = 0.0
+
+            def append_oldest():
+                nonlocal appended, last_progress
+                appended += 1
+                # Each update crosses to the GUI process and repaints the
+                # status label, so fast pages are reported at most ~10 times
+                # a second.
+                now = time.monotonic()
+                if now - last_progress >= PROGRESS_INTERVAL:
+                    last_progress = now
+                    emit_progress(f"Rendering page {appended}/{submitted}...")
+                pdf_bytes = pending.popleft().result()
+                if pdf_bytes:
+                    appender.append(pdf_bytes)
+
+            for chunks, recovery_info in files:
+                file_label = recovery_info.get('export_file_name', 'file') if recovery_info else "manual entry"
+                emit_progress(f"Preparing {len(chunks)} chunk(s) for {file_label}...")
+                page_jobs = collect_page_jobs(chunks, recovery_info, snippet_index, page_options)
+                for job in page_jobs:
+                    pending.append(pool.submit(render_page_bytes, job))
+                    submitted += 1
+                    while len(pending) > MAX_PAGES_IN_FLIGHT or (pending and pending[0].done()):
+                        append_oldest()
+
+            while pending:
+                append_oldest()
+
+        # --- Write the main PDF once ---
+        if appender.new_page_count:
+            emit_progress(f"Saving {appender.new_page_count} new page(s) to {main_pdf_name}...")
+            appender.flush()
+    finally:
+        # Nothing renders between tasks, so close the browser too, and drop
+        # the encoded images instead of holding them until the next task.
+        close_renderer()
+        encode_image_file.cache_clear()
+        appender.close()
+
+def _task_files(task_queue):
+    """Yields the `(chunks, recovery_info)` pairs of the current task.
+
+    Stops at the task's "end" message. A None sentinel also ends the task
+    and is put back, so the main loop sees it and exits.
+    """
+    while True:
+        message = task_queue.get()
+        if message is None:
+            task_queue.put(None)
+            return
+        if message[0] == "end":
+            return
+        _, chunks, recovery_info = message
+        yield chunks, recovery_info
+
+def pdf_worker_main(task_queue, event_queue, stop_event):
+    """The main loop of the PDF worker process.
+
+    A task arrives as a sequence of messages: `("begin", main_pdf_path,
+    show_headings, user_heading, model_heading)`, then one `("file", chunks,
+    recovery_info)` per file, then `("end",)`. Files are rendered as they
+    arrive, so a folder import streams its files while the user reviews the
+    rest. Status updates are put on `event_queue` as `("progress", message)`
+    and `("finished", message)`; a final None tells the GUI the worker exited.
+
+    Args:
+        task_queue (multiprocessing.Queue): The queue of task messages. A None
+            sentinel stops the worker.
+        event_queue (multiprocessing.Queue): The queue for status events.
+        stop_event (multiprocessing.Event): Once set, tasks that have not
+            started yet are dropped.
+    """
+    def emit_progress(message):
+        event_queue.put(("progress", message))
+
+    while True:
+        # Block until there is work; the process sleeps while idle.
+        message = task_queue.get()
+        if message is None or stop_event.is_set():  # Sentinel value to stop
+            break
+        if message[0] != "begin":
+            continue  # Leftovers of a task that was cut short
+
+        files = _task_files(task_queue)
+        try:
+            run_task(*message[1:], files=files, emit_progress=emit_progress)
+            event_queue.put(("finished", "Task completed successfully!"))
+        except Exception as e:
+            event_queue.put(("finished", f"Error: {e}"))
+        finally:
+            # Drain the rest of a failed task so its files are not mistaken
+            # for the next task.
+            for _ in files:
+                pass
+
+    event_queue.put(("finished", "All tasks completed successfully!"))
+    event_queue.put(None)
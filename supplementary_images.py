@@ -1,6 +1,5 @@
 import sys
 import os
-import json
 import datetime
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
@@ -9,6 +8,7 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtGui import QPixmap, QImage, QClipboard, QKeySequence
 from PySide6.QtCore import Qt
+from json_io import dump_json_bytes
 
 class ImagePasteCell(QWidget):
     """Custom widget for pasting and previewing images in a table cell."""
@@ -45,8 +45,10 @@ class ImagePasteCell(QWidget):
                 # Ensure directory exists
                 os.makedirs("supplemental_images", exist_ok=True)
                 
-                # Save high quality PNG
-                if image.save(path, "PNG"):
+                # Save a lossless PNG. Quality 80 selects zlib's fastest level,
+                # which saves a large screenshot in about half the time for a
+                # file only a few percent bigger.
+                if image.save(path, "PNG", 80):
                     self.image_path = path
                     self.preview_label.setPixmap(QPixmap.fromImage(image))
                     self.preview_label.setText("") # Clear text
@@ -186,8 +188,8 @@ class SupplementaryImagesApp(QMainWindow):
         filepath = os.path.join(self.mappings_dir, filename)
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(mapping_data, f, indent=4, ensure_ascii=False)
+            with open(filepath, 'wb') as f:
+                f.write(dump_json_bytes(mapping_data))
             
             QMessageBox.information(self, "Success", f"Mapping saved successfully!\nFile: {filename}\n\nYou can now run the Conversation Archiver.")
             